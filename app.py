@@ -1,27 +1,37 @@
 import os
-import secrets
+import logging
 from pathlib import Path
 
 from fastapi import FastAPI, Request, File, UploadFile, HTTPException, Form
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, ORJSONResponse, StreamingResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.middleware.sessions import SessionMiddleware
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 import uvicorn
 from dotenv import load_dotenv
-import io
-import json
+import orjson
+import time
+import hashlib
+import heapq
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 
 # Import our modules
-from resume_parser import parse_resume, is_valid_resume
-from job_scrapers.dispatcher import scrape_jobs
-from matching.matcher import match_resume_to_jobs
-from matching.metadata_matcher import extract_resume_metadata
+from app_logging import configure_logging, configure_worker_logging, stop_logging
+from resume_parser import parse_resume, preload_parser_dependencies, is_valid_resume, get_cached_parse, cache_parse_result
+from job_scrapers.dispatcher import scrape_jobs, scrape_jobs_full, scrape_jobs_incremental
+from matching.matcher import match_resume_to_jobs, match_resume_to_jobs_with_status, match_resume_to_jobs_legacy, get_prefilter_features
+from matching.skill_index import get_skill_index
+from matching.match_cache import get_cached_matches, cache_matches
 import job_cache
-from s3_service import upload_resume_to_s3, download_resume_from_s3, delete_resume_from_s3
+from job_cache import get_jobs_for_matching
+from job_database import get_database_stats
+from s3_service import upload_resume_to_s3, delete_resume_from_s3
 
 # Base directory of this file (used for templates/static/uploads paths)
 BASE_DIR = Path(__file__).resolve().parent
@@ -29,8 +39,12 @@ BASE_DIR = Path(__file__).resolve().parent
 # Load environment variables
 load_dotenv()
 
+# Per-job matching details are logged at DEBUG; set LOG_LEVEL=DEBUG to see them
+configure_logging()
+logger = logging.getLogger(__name__)
+
 # Create FastAPI app
-app = FastAPI(title="Internship Matcher", version="1.0.0")
+app = FastAPI(title="Internship Matcher", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Add CORS middleware for React frontend
 app.add_middleware(
@@ -49,20 +63,328 @@ app.add_middleware(
 # Add session middleware for basic session support
 app.add_middleware(SessionMiddleware, secret_key=os.getenv("SECRET_KEY", "your-secret-key-here"))
 
+
+# Server-sent event streams must reach the client event by event; gzip would hold
+# them back in its compression buffer, so these paths are passed through untouched
+UNCOMPRESSED_PATHS = frozenset({"/api/match-stream"})
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that skips the streaming progress endpoints"""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in UNCOMPRESSED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress the results page and JSON job lists (tens to hundreds of KB uncompressed);
+# levels above 4-5 cost noticeably more CPU for little extra ratio on HTML/JSON
+GZIP_MIN_SIZE = int(os.getenv("GZIP_MIN_SIZE", "512"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "4"))
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=GZIP_MIN_SIZE, compresslevel=GZIP_LEVEL)
+
 # Setup templates and static files using absolute paths
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
-app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
+STATIC_CACHE_CONTROL = os.getenv("STATIC_CACHE_CONTROL", "public, max-age=86400")
+# Templates are compiled once and the bytecode kept across restarts; outside
+# development the per-render stat() check for edited templates is skipped
+JINJA_CACHE_DIR = Path(os.getenv("JINJA_CACHE_DIR", "/tmp/jinja_cache"))
+os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+template_env = Environment(
+    loader=FileSystemLoader(str(BASE_DIR / "templates")),
+    autoescape=True,
+    bytecode_cache=FileSystemBytecodeCache(str(JINJA_CACHE_DIR)),
+    auto_reload=os.getenv("ENVIRONMENT", "development").lower() == "development",
+)
+templates = Jinja2Templates(env=template_env)
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that lets browsers keep assets for a day. The files aren't
+    fingerprinted, so they are not marked immutable; after expiry the ETag /
+    Last-Modified revalidation StaticFiles already does turns refetches into 304s.
+    """
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", STATIC_CACHE_CONTROL)
+        return response
+
+
+def markupsafe_speedups_available():
+    """Whether MarkupSafe's C escape() is in use; without it every template render escapes in pure Python"""
+    try:
+        from markupsafe import _speedups  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# Rendered empty dashboard per base URL (url_for in the template depends on it);
+# only a handful of hostnames ever reach the app, so the bound is a safety net
+_dashboard_html_cache = {}
+DASHBOARD_CACHE_MAX_ENTRIES = 16
+app.mount("/static", CachedStaticFiles(directory=str(BASE_DIR / "static")), name="static")
 
 # Create upload folder if it doesn't exist (absolute path)
 UPLOAD_FOLDER = BASE_DIR / "uploads"
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+# Resume file types we can parse (PDF text extraction or image OCR)
+ALLOWED_EXTENSIONS = frozenset({'pdf', 'png', 'jpg', 'jpeg'})
+
+
+# Leading bytes each allowed file type must start with, so a renamed file is caught early
+FILE_SIGNATURES = {
+    'pdf': (b'%PDF',),
+    'png': (b'\x89PNG',),
+    'jpg': (b'\xff\xd8\xff',),
+    'jpeg': (b'\xff\xd8\xff',),
+}
+
+
+def get_file_extension(filename):
+    """Lowercased extension of an uploaded filename, without the dot"""
+    return os.path.splitext(filename or '')[1][1:].lower()
+
+
+async def has_valid_signature(upload: UploadFile, file_extension: str):
+    """
+    Check the upload's first bytes match its extension, then rewind it for the real read.
+    Empty uploads pass here so they get the more helpful empty-file error later.
+    """
+    header = await upload.read(8)
+    await upload.seek(0)
+    return not header or header.startswith(FILE_SIGNATURES.get(file_extension, ()))
+
+
+# Uploads are read in fixed-size chunks so an oversized body is cut off as soon as it crosses the limit
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# Largest resume accepted; bigger uploads are rejected with 413 as soon as they cross it
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+# Form field names, boundaries and part headers sent alongside the file
+MULTIPART_OVERHEAD_BYTES = 16 * 1024
+
+
+def upload_too_large_error():
+    """The 413 raised when an upload crosses MAX_UPLOAD_BYTES"""
+    return HTTPException(
+        status_code=413,
+        detail=f"File too large. Maximum size is {MAX_UPLOAD_BYTES // (1024 * 1024)} MB."
+    )
+
+
+# Endpoints that accept a resume upload
+UPLOAD_PATHS = frozenset({"/match", "/api/match", "/api/match-stream"})
+
+
+class BodySizeLimitMiddleware:
+    """
+    Reject oversized uploads before FastAPI parses the multipart body. Handlers only
+    run after the whole form has been received and spooled, so without this a huge
+    body is read in full just to be refused.
+    A declared Content-Length over the limit gets a 413 without reading anything;
+    bodies sent without one are cut off once they cross it.
+    """
+
+    def __init__(self, app, max_body_size):
+        self.app = app
+        self.max_body_size = max_body_size
+
+    @staticmethod
+    def too_large_response(scope):
+        """
+        The 413 in the form each endpoint's client reads: an SSE error event for the
+        stream (the frontend only reads errors from the event stream, so it is sent
+        with a 200 like the endpoint's other errors), JSON for the other API
+        endpoint, and the dashboard page with the error for the form post.
+        """
+        error = upload_too_large_error()
+        if scope["path"] == "/api/match-stream":
+            return Response(sse_event({'error': error.detail}), media_type="text/event-stream", headers=SSE_HEADERS)
+        if scope["path"].startswith("/api/"):
+            return ORJSONResponse({"detail": error.detail}, status_code=error.status_code)
+        return templates.TemplateResponse("dashboard.html", {
+            "request": Request(scope),
+            "results": None,
+            "error": error.detail
+        }, status_code=error.status_code)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in UPLOAD_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_body_size:
+            await self.too_large_response(scope)(scope, receive, send)
+            return
+
+        received = 0
+        exceeded = False
+
+        async def limited_receive():
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    exceeded = True
+                    raise upload_too_large_error()
+            return message
+
+        async def guarded_send(message):
+            # Once the body is cut off, the app's own (JSON) 413 is dropped in
+            # favour of the same per-endpoint response as the Content-Length check
+            if not exceeded:
+                await send(message)
+
+        await self.app(scope, limited_receive, guarded_send)
+        if exceeded:
+            await self.too_large_response(scope)(scope, receive, send)
+
+
+app.add_middleware(BodySizeLimitMiddleware, max_body_size=MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES)
+
+
+async def read_upload(upload: UploadFile):
+    """
+    Read an upload into memory chunk by chunk, hashing it on the way. Memory is
+    bounded by MAX_UPLOAD_BYTES instead of by whatever the client sends.
+    Returns (content, sha256 hex digest).
+    Raises HTTPException(413) once the upload exceeds MAX_UPLOAD_BYTES.
+    """
+    hasher = hashlib.sha256()
+    chunks = []
+    size = 0
+    while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+        size += len(chunk)
+        if size > MAX_UPLOAD_BYTES:
+            raise upload_too_large_error()
+        hasher.update(chunk)
+        chunks.append(chunk)
+    # One copy into the final bytes, instead of a growing bytearray that is
+    # reallocated as it fills and then copied again into bytes
+    return b"".join(chunks), hasher.hexdigest()
+
+
+# Threads for blocking work offloaded with asyncio.to_thread (Redis/DB reads,
+# S3 transfers, LLM calls); the asyncio default of min(32, cpus + 4) is too small
+# when every in-flight match holds a thread while it waits on the LLM
+THREAD_POOL_WORKERS = int(os.getenv("THREAD_POOL_WORKERS", "64"))
+
+# uvicorn worker processes serving requests (uvicorn itself reads WEB_CONCURRENCY too)
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# Worker processes for resume parsing (PDF text extraction / OCR is CPU-bound and
+# would otherwise block the event loop); created on first use. Each uvicorn worker
+# has its own pool, so by default the cores are split between them.
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", str(max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY))))
+_parse_pool = None
+
+
+def init_parse_worker():
+    """Parsing pool initializer: working logging first, then the parser's imports"""
+    configure_worker_logging()
+    preload_parser_dependencies()
+
+
+def get_parse_pool():
+    """Return the shared resume-parsing process pool, creating it if needed"""
+    global _parse_pool
+    if _parse_pool is None:
+        # Each worker imports PyMuPDF/pytesseract as it starts, not on its first resume
+        _parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS, initializer=init_parse_worker)
+    return _parse_pool
+
+
+async def warm_parse_pool():
+    """Start every parsing worker now so the first uploads don't wait on process start-up and imports"""
+    loop = asyncio.get_running_loop()
+    pool = get_parse_pool()
+    await asyncio.gather(*(loop.run_in_executor(pool, time.sleep, 0.1) for _ in range(PARSE_WORKERS)))
+
+
+async def parse_resume_in_pool(file_content, filename, use_llm=True):
+    """Run parse_resume in the shared parsing pool without blocking the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(
+        get_parse_pool(), parse_resume, file_content, filename, use_llm
+    )
+
+
+async def parse_resume_cached(file_content, filename, digest, use_llm=True):
+    """
+    Parse a resume in the parsing pool, reusing an earlier parse of identical content
+    from this worker's memory or, failing that, from Redis. The PDF is opened once:
+    the validator runs on the text the parse already extracted.
+    Returns ((skills, text, metadata), is_valid) where is_valid is the resume validator's verdict.
+    """
+    cached_parse = get_cached_parse(digest, use_llm)
+    if cached_parse:
+        logger.info("⚡ Reusing cached parse for resume %s", digest[:12])
+        return cached_parse["result"], cached_parse["is_valid"]
+
+    # Another worker may have parsed the same file already
+    shared_parse = await asyncio.to_thread(job_cache.get_resume_cache, digest, use_llm)
+    if shared_parse:
+        logger.info("⚡ Reusing shared cached parse for resume %s", digest[:12])
+        result = (shared_parse["skills"], shared_parse["text"], shared_parse["metadata"])
+        cache_parse_result(digest, use_llm, result, shared_parse["is_valid"])
+        return result, shared_parse["is_valid"]
+
+    result = await parse_resume_in_pool(file_content, filename, use_llm)
+    resume_skills, resume_text, resume_metadata = result
+    is_valid = not resume_text or is_valid_resume(resume_text)
+    # A parse that found no skills is an error for the caller; let a retry parse again
+    if resume_skills:
+        cache_parse_result(digest, use_llm, result, is_valid)
+        # Share it with the other workers without holding up this request
+        start_background_task(asyncio.to_thread(
+            job_cache.set_resume_cache, digest, use_llm, resume_skills, resume_text, resume_metadata, is_valid
+        ))
+    return result, is_valid
+
+# Quick (non-LLM) mode and the fallback matcher only show this many results
+QUICK_MODE_RESULT_LIMIT = 10
+
+# In-process snapshot of the job list so requests skip the Redis/DB round trip
+JOBS_SNAPSHOT_TTL = int(os.getenv("JOBS_SNAPSHOT_TTL", "900"))  # seconds
+# version increases on every swap, so derived data can tell which snapshot it came from
+_jobs_snapshot = {"jobs": None, "loaded_at": 0.0, "version": 0}
+# Single-flight guard: only one request reloads (or scrapes) on a snapshot miss
+_jobs_snapshot_lock = asyncio.Lock()
+# Background reload of an expired snapshot that is still being served (at most one at a time)
+_jobs_snapshot_revalidation = {"task": None}
+# A background task reloads the snapshot ahead of expiry, keeping reloads off the request path
+JOBS_SNAPSHOT_REFRESH_INTERVAL = int(os.getenv("JOBS_SNAPSHOT_REFRESH_INTERVAL", str(JOBS_SNAPSHOT_TTL * 2 // 3)))
+# With several uvicorn workers only the one holding these claims scrapes; the
+# others pick the results up through their snapshot refresh
+STARTUP_SCRAPE_LOCK_TTL = 15 * 60
+DAILY_REFRESH_LOCK_TTL = 12 * 60 * 60
+
+# Strong references to long-running background tasks; the event loop only keeps weak ones
+_background_tasks = set()
+
+
+def start_background_task(coro):
+    """Run a coroutine as a background task that lives until shutdown"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
 # Startup event to initialize hybrid cache system
 @app.on_event("startup")
 async def startup_event():
     """Initialize hybrid Redis + Database cache system on server startup"""
     environment = os.getenv("ENVIRONMENT", "development").lower()
-    print(f"🚀 Starting up Internship Matcher [{environment.upper()}] with Hybrid Cache System...")
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=THREAD_POOL_WORKERS))
+    logger.info("🚀 Starting up Internship Matcher [%s] with Hybrid Cache System...", environment.upper())
+    logger.info("⚙️ Event loop: %s", type(asyncio.get_running_loop()).__module__)
+    if not markupsafe_speedups_available():
+        logger.warning("⚠️ MarkupSafe C speedups not installed - template escaping runs in pure Python")
 
     # Initialize hybrid cache (Redis + Database)
     cache_available = job_cache.init_redis()
@@ -85,36 +407,39 @@ async def startup_event():
 
                 if last_update:
                     # Parse last update time and check if it's stale
-                    from datetime import datetime, timedelta
                     try:
                         last_update_time = datetime.fromisoformat(last_update.replace('Z', '+00:00'))
                         time_since_update = datetime.now(last_update_time.tzinfo) - last_update_time
 
                         # Refresh if cache is older than 6 hours in dev
                         if time_since_update > timedelta(hours=6):
-                            print(f"🔄 Cache is {time_since_update.total_seconds() / 3600:.1f} hours old - refreshing...")
+                            logger.info("🔄 Cache is %.1f hours old - refreshing...", time_since_update.total_seconds() / 3600)
                             should_refresh = True
                         else:
-                            print(f"📦 Using existing cache: {len(cached_jobs)} jobs (updated {time_since_update.total_seconds() / 3600:.1f} hours ago)")
+                            logger.info("📦 Using existing cache: %d jobs (updated %.1f hours ago)", len(cached_jobs), time_since_update.total_seconds() / 3600)
                     except Exception as e:
-                        print(f"⚠️ Error parsing cache timestamp: {e}")
+                        logger.warning("⚠️ Error parsing cache timestamp: %s", e)
                         should_refresh = False
                 else:
-                    print(f"📦 Using existing cache: {len(cached_jobs)} jobs available")
+                    logger.info("📦 Using existing cache: %d jobs available", len(cached_jobs))
             else:
                 # No cache - always refresh
                 should_refresh = True
-                print("📥 No cached jobs found - initializing cache...")
+                logger.info("📥 No cached jobs found - initializing cache...")
         else:
             # Production: only initialize if cache is empty
             if cached_jobs:
-                print(f"📦 Using existing cache: {len(cached_jobs)} jobs available")
-                print(f"🔍 Cache status: {cache_info.get('hybrid', {}).get('message', 'Unknown')}")
+                logger.info("📦 Using existing cache: %d jobs available", len(cached_jobs))
+                logger.info("🔍 Cache status: %s", cache_info.get('hybrid', {}).get('message', 'Unknown'))
             else:
                 should_refresh = True
-                print("📥 No cached jobs found - initializing cache...")
+                logger.info("📥 No cached jobs found - initializing cache...")
+
+        # Perform cache refresh if needed, in one worker only
+        if should_refresh and not job_cache.acquire_scrape_lock("startup", STARTUP_SCRAPE_LOCK_TTL):
+            logger.info("⏭️ Another worker is initializing the cache - skipping startup scrape")
+            should_refresh = False
 
-        # Perform cache refresh if needed
         if should_refresh:
             try:
                 # Use smart scraping (auto-detects incremental vs full)
@@ -124,33 +449,56 @@ async def startup_event():
                     # Store in hybrid cache system
                     cache_result = job_cache.set_cached_jobs(jobs, cache_type='startup')
                     if cache_result.get('database_success') or cache_result.get('redis_success'):
-                        print(f"✅ Startup cache initialized: {cache_result.get('new_jobs', 0)} new jobs, {len(jobs)} total")
+                        logger.info("✅ Startup cache initialized: %s new jobs, %d total", cache_result.get('new_jobs', 0), len(jobs))
                     else:
-                        print("⚠️ Cache initialization failed")
+                        logger.warning("⚠️ Cache initialization failed")
                 else:
-                    print("⚠️ No jobs scraped on startup")
+                    logger.warning("⚠️ No jobs scraped on startup")
             except Exception as e:
-                print(f"❌ Error during startup scraping: {e}")
+                logger.error("❌ Error during startup scraping: %s", e)
     else:
-        print("❌ Hybrid cache system unavailable - jobs will be scraped per request")
+        logger.error("❌ Hybrid cache system unavailable - jobs will be scraped per request")
     
     # Print final cache status
     try:
         final_info = job_cache.get_cache_info()
         if final_info.get('database', {}).get('status') == 'active':
             db_info = final_info['database']
-            print(f"📊 Database: {db_info.get('active_jobs', 0)} active jobs")
+            logger.info("📊 Database: %s active jobs", db_info.get('active_jobs', 0))
         if final_info.get('redis', {}).get('status') == 'active':
             redis_info = final_info['redis']
-            print(f"⚡ Redis: {redis_info.get('job_count', 0)} jobs cached")
+            logger.info("⚡ Redis: %s jobs cached", redis_info.get('job_count', 0))
     except Exception as e:
-        print(f"⚠️ Error getting final cache status: {e}")
+        logger.warning("⚠️ Error getting final cache status: %s", e)
     
-    print("✅ Startup complete!")
+    # Start the resume parsing workers in the background while startup continues
+    start_background_task(warm_parse_pool())
+
+    # Warm the in-process job snapshot so the first request doesn't pay for it
+    if cache_available:
+        await get_jobs_with_cache()
+
+    logger.info("✅ Startup complete!")
 
     # Start background task for daily cache refresh
-    asyncio.create_task(daily_cache_refresh_task())
-    print("🕒 Daily cache refresh scheduler started")
+    start_background_task(daily_cache_refresh_task())
+    logger.info("🕒 Daily cache refresh scheduler started")
+
+    # Keep the in-process snapshot fresh from the cache; without a cache every
+    # reload would be a full scrape, so leave that to the request path
+    if cache_available:
+        start_background_task(jobs_snapshot_refresh_task())
+        logger.info("🕒 Job snapshot refresh every %d seconds", JOBS_SNAPSHOT_REFRESH_INTERVAL)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks, release worker processes and flush queued log records on server shutdown"""
+    for task in list(_background_tasks):
+        task.cancel()
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+    stop_logging()
 
 
 async def daily_cache_refresh_task():
@@ -163,7 +511,12 @@ async def daily_cache_refresh_task():
             # Wait 24 hours before first refresh (cache was just initialized on startup)
             await asyncio.sleep(24 * 60 * 60)  # 24 hours in seconds
 
-            print(f"🔄 [Scheduled] Starting daily cache refresh at {datetime.utcnow().isoformat()}")
+            # Every worker runs this loop; only the first to wake up scrapes
+            if not await asyncio.to_thread(job_cache.acquire_scrape_lock, "daily", DAILY_REFRESH_LOCK_TTL):
+                logger.info("⏭️ [Scheduled] Another worker is running the daily refresh")
+                continue
+
+            logger.info("🔄 [Scheduled] Starting daily cache refresh at %s", datetime.utcnow().isoformat())
 
             # Perform smart scraping with 30-day filter
             jobs = await scrape_jobs(max_days_old=30)
@@ -174,18 +527,21 @@ async def daily_cache_refresh_task():
                 new_jobs = cache_result.get('new_jobs', 0)
                 total_jobs = cache_result.get('total_jobs', len(jobs))
 
+                # Swap the refreshed jobs into the in-process snapshot right away
+                await refresh_jobs_snapshot()
+
                 if cache_result.get('database_success') or cache_result.get('redis_success'):
-                    print(f"✅ [Scheduled] Daily refresh complete: {new_jobs} new jobs, {total_jobs} total active jobs")
+                    logger.info("✅ [Scheduled] Daily refresh complete: %s new jobs, %s total active jobs", new_jobs, total_jobs)
                 else:
-                    print(f"⚠️ [Scheduled] Cache refresh failed")
+                    logger.warning("⚠️ [Scheduled] Cache refresh failed")
             else:
-                print("📝 [Scheduled] No new jobs found in daily refresh")
+                logger.info("📝 [Scheduled] No new jobs found in daily refresh")
 
         except asyncio.CancelledError:
-            print("🛑 Daily cache refresh task cancelled")
+            logger.info("🛑 Daily cache refresh task cancelled")
             break
         except Exception as e:
-            print(f"❌ [Scheduled] Error in daily cache refresh: {e}")
+            logger.error("❌ [Scheduled] Error in daily cache refresh: %s", e)
             # Continue running even if one refresh fails
             continue
 
@@ -194,16 +550,132 @@ async def get_jobs_with_cache():
     """
     Get jobs using hybrid cache system (Redis + Database).
     This function is used by all endpoints to get job data efficiently.
+    Results are held in memory for JOBS_SNAPSHOT_TTL seconds, and concurrent
+    misses share a single reload instead of each hitting the cache or scraping.
+    An expired snapshot is still served while it is reloaded in the background;
+    only the very first load makes a request wait.
+    """
+    if _is_jobs_snapshot_fresh():
+        return _jobs_snapshot["jobs"]
+
+    if _jobs_snapshot["jobs"]:
+        revalidation = _jobs_snapshot_revalidation["task"]
+        if revalidation is None or revalidation.done():
+            _jobs_snapshot_revalidation["task"] = start_background_task(_revalidate_jobs_snapshot())
+        return _jobs_snapshot["jobs"]
+
+    async with _jobs_snapshot_lock:
+        # Another request may have reloaded the snapshot while we were waiting
+        if _is_jobs_snapshot_fresh():
+            return _jobs_snapshot["jobs"]
+
+        return await _reload_jobs_snapshot()
+
+
+async def match_resume_cached(digest, mode, resume_skills, jobs, resume_text, resume_text_lower):
+    """
+    Match a parsed resume against the current job snapshot, reusing the earlier
+    result for the same resume content, parsing mode and snapshot.
+    mode names how the resume was parsed ("llm" or "text"), since that changes its skills.
+    """
+    snapshot_version = get_jobs_snapshot_version()
+    matched_jobs = get_cached_matches(digest, snapshot_version, mode)
+    if matched_jobs is not None:
+        logger.info("⚡ Reusing cached matches for resume %s", digest[:12])
+        return matched_jobs
+
+    # Matching makes a blocking LLM call; keep it off the event loop
+    matched_jobs, used_fallback = await asyncio.to_thread(
+        match_resume_to_jobs_with_status, resume_skills, jobs, resume_text, resume_text_lower
+    )
+    # Results scored without the LLM (after a transient API error) aren't cached,
+    # so the next attempt gets a real analysis instead of the fallback for the TTL
+    if matched_jobs and not used_fallback:
+        cache_matches(digest, snapshot_version, matched_jobs, mode)
+    return matched_jobs
+
+
+def prefetch_jobs():
+    """
+    Start loading the job list in the background so it overlaps with parsing the resume.
+    Returns the task; await it where the jobs are needed.
+    """
+    task = asyncio.create_task(get_jobs_with_cache())
+    # Retrieve a failure even if the request ends before awaiting the task
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    return task
+
+
+async def _revalidate_jobs_snapshot():
+    """Reload an expired snapshot unless another reload got there first"""
+    try:
+        async with _jobs_snapshot_lock:
+            if not _is_jobs_snapshot_fresh():
+                await _reload_jobs_snapshot()
+    except Exception as e:
+        # Keep serving the previous snapshot; the next request past the TTL tries again
+        logger.error("❌ Error reloading expired job snapshot: %s", e)
+
+
+async def refresh_jobs_snapshot():
+    """Reload the in-process job snapshot now, whatever its age"""
+    async with _jobs_snapshot_lock:
+        return await _reload_jobs_snapshot()
+
+
+async def _reload_jobs_snapshot():
+    """Load jobs and swap them in as the new snapshot; the caller holds _jobs_snapshot_lock"""
+    jobs = await load_jobs()
+    if jobs:
+        # Index the new snapshot's skills and prefilter features now rather than on
+        # the next match (on a worker thread, so the event loop keeps serving meanwhile)
+        await asyncio.to_thread(get_skill_index, jobs)
+        await asyncio.to_thread(get_prefilter_features, jobs)
+        _jobs_snapshot.update(jobs=jobs, loaded_at=time.monotonic(), version=_jobs_snapshot["version"] + 1)
+    return jobs
+
+
+def get_jobs_snapshot_version():
+    """Identifier of the current job snapshot; changes whenever new jobs are swapped in"""
+    return _jobs_snapshot["version"]
+
+
+async def jobs_snapshot_refresh_task():
+    """
+    Background task that reloads the job snapshot before it expires,
+    so requests are served from memory instead of waiting on a reload.
+    """
+    while True:
+        try:
+            await asyncio.sleep(JOBS_SNAPSHOT_REFRESH_INTERVAL)
+            jobs = await refresh_jobs_snapshot()
+            logger.debug("🔄 Job snapshot refreshed: %d jobs", len(jobs or []))
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.error("❌ Error refreshing job snapshot: %s", e)
+            # Keep serving the previous snapshot and try again next interval
+            continue
+
+
+def _is_jobs_snapshot_fresh():
+    """Check whether the in-process job snapshot can be served as is"""
+    return bool(_jobs_snapshot["jobs"]) and time.monotonic() - _jobs_snapshot["loaded_at"] < JOBS_SNAPSHOT_TTL
+
+
+async def load_jobs():
+    """
+    Load jobs from the hybrid cache, scraping on a cache miss.
     """
     # Try to get from hybrid cache system
-    cached_jobs = job_cache.get_cached_jobs()
+    cached_jobs = await asyncio.to_thread(job_cache.get_cached_jobs)
     
     if cached_jobs:
-        print(f"⚡ Using {len(cached_jobs)} jobs from hybrid cache")
+        logger.info("⚡ Using %d jobs from hybrid cache", len(cached_jobs))
         return cached_jobs
     
     # Cache miss - use smart scraping strategy
-    print("🌐 Cache miss - using smart scraping strategy...")
+    logger.info("🌐 Cache miss - using smart scraping strategy...")
     try:
         # Smart scraping automatically detects incremental vs full
         # Default to 30-day filter to only get recent jobs
@@ -211,32 +683,31 @@ async def get_jobs_with_cache():
         
         # Store in hybrid cache system
         if jobs:
-            cache_result = job_cache.set_cached_jobs(jobs, cache_type='on_demand')
+            cache_result = await asyncio.to_thread(job_cache.set_cached_jobs, jobs, cache_type='on_demand')
             new_jobs = cache_result.get('new_jobs', 0)
             total_jobs = cache_result.get('total_jobs', len(jobs))
             
             if cache_result.get('database_success') or cache_result.get('redis_success'):
-                print(f"✅ Scraped and cached: {new_jobs} new jobs, {total_jobs} total")
+                logger.info("✅ Scraped and cached: %s new jobs, %s total", new_jobs, total_jobs)
             else:
-                print(f"⚠️ Scraping successful but caching failed: {total_jobs} jobs")
+                logger.warning("⚠️ Scraping successful but caching failed: %s jobs", total_jobs)
             
             # Return all active jobs from cache for consistency
-            return job_cache.get_cached_jobs() or jobs
+            return await asyncio.to_thread(job_cache.get_cached_jobs) or jobs
         else:
-            print("⚠️ No jobs scraped")
+            logger.warning("⚠️ No jobs scraped")
             return []
             
     except Exception as e:
-        print(f"❌ Error during smart scraping: {e}")
+        logger.error("❌ Error during smart scraping: %s", e)
         # Try to get any available jobs from database as fallback
         try:
-            from job_cache import get_jobs_for_matching
-            fallback_jobs = get_jobs_for_matching()
+            fallback_jobs = await asyncio.to_thread(get_jobs_for_matching)
             if fallback_jobs:
-                print(f"🔄 Using {len(fallback_jobs)} fallback jobs from database")
+                logger.info("🔄 Using %d fallback jobs from database", len(fallback_jobs))
                 return fallback_jobs
         except Exception as fallback_error:
-            print(f"❌ Fallback also failed: {fallback_error}")
+            logger.error("❌ Fallback also failed: %s", fallback_error)
         
         return []
 
@@ -250,11 +721,18 @@ async def index(request: Request):
 @app.get("/dashboard", response_class=HTMLResponse)
 async def dashboard(request: Request):
     """Dashboard - main page for resume upload"""
-    return templates.TemplateResponse("dashboard.html", {
-        "request": request,
-        "results": None,
-        "error": None
-    })
+    # The empty upload page is the same for everyone: render it once and serve the bytes,
+    # and let browsers and proxies reuse it too. In development templates can change, so
+    # render every time there.
+    base_url = str(request.base_url)
+    body = _dashboard_html_cache.get(base_url)
+    if body is None:
+        body = template_env.get_template("dashboard.html").render(
+            request=request, results=None, error=None
+        ).encode("utf-8")
+        if not template_env.auto_reload and len(_dashboard_html_cache) < DASHBOARD_CACHE_MAX_ENTRIES:
+            _dashboard_html_cache[base_url] = body
+    return HTMLResponse(body, headers={"Cache-Control": "public, max-age=300"})
 
 
 @app.post("/match", response_class=HTMLResponse)
@@ -270,40 +748,59 @@ async def match_resume(request: Request, resume: UploadFile = File(...)):
             })
 
         # Check file extension
-        file_extension = resume.filename.split('.')[-1].lower() if resume.filename else ''
-        allowed_extensions = ['pdf', 'png', 'jpg', 'jpeg']
-        
-        if file_extension not in allowed_extensions:
+        file_extension = get_file_extension(resume.filename)
+        if file_extension not in ALLOWED_EXTENSIONS:
             return templates.TemplateResponse("dashboard.html", {
                 "request": request,
                 "results": None,
                 "error": f"Invalid file type '{file_extension}'. Please upload a PDF, PNG, JPG, or JPEG file."
-            })
+            }, status_code=415)
 
-        # Read file content
+        # Cheap rejection before copying anything: the file's magic bytes
+        # (oversized bodies never reach the handler, BodySizeLimitMiddleware refuses them)
+        if not await has_valid_signature(resume, file_extension):
+            return templates.TemplateResponse("dashboard.html", {
+                "request": request,
+                "results": None,
+                "error": f"The uploaded file is not a valid {file_extension.upper()} file."
+            }, status_code=415)
+
+        # Read file content; it is parsed straight from memory
         try:
-            file_content = await resume.read()
+            file_content, file_digest = await read_upload(resume)
             if not file_content:
                 return templates.TemplateResponse("dashboard.html", {
                     "request": request,
                     "results": None,
                     "error": "The uploaded file appears to be empty. Please upload a valid resume file."
                 })
+        except HTTPException as e:
+            return templates.TemplateResponse("dashboard.html", {
+                "request": request,
+                "results": None,
+                "error": e.detail
+            }, status_code=e.status_code)
         except Exception as e:
-            print(f"❌ Error reading file: {e}")
+            logger.error("❌ Error reading file: %s", e)
             return templates.TemplateResponse("dashboard.html", {
                 "request": request,
                 "results": None,
                 "error": f"Error reading the uploaded file: {str(e)}"
             })
 
-        print(f"📥 Uploaded: {resume.filename}")
-        print(f"📊 File size: {len(file_content)} bytes")
-        print(f"🔍 File type: {resume.content_type}")
+        logger.info("📥 Uploaded: %s", resume.filename)
+        logger.info("📊 File size: %d bytes", len(file_content))
+        logger.info("🔍 File type: %s", resume.content_type)
+
+        # Load jobs while the resume is parsed
+        jobs_task = prefetch_jobs()
 
-        # Parse resume using LLM (returns skills, text, and metadata)
+        # Parse resume using LLM (returns skills, text, and metadata);
+        # a re-upload of the same file reuses the earlier parse and verdict
         try:
-            resume_skills, resume_text, resume_metadata = parse_resume(file_content, resume.filename)
+            (resume_skills, resume_text, resume_metadata), resume_is_valid = await parse_resume_cached(
+                file_content, resume.filename, file_digest
+            )
             if not resume_skills:
                 return templates.TemplateResponse("dashboard.html", {
                     "request": request,
@@ -311,18 +808,21 @@ async def match_resume(request: Request, resume: UploadFile = File(...)):
                     "error": "No skills were detected in your resume. Please make sure your resume includes technical skills, programming languages, or relevant experience."
                 })
         except Exception as e:
-            print(f"❌ Error parsing resume: {e}")
+            logger.error("❌ Error parsing resume: %s", e)
             return templates.TemplateResponse("dashboard.html", {
                 "request": request,
                 "results": None,
                 "error": f"Error parsing your resume: {str(e)}"
             })
 
-        print(f"🔍 Extracted resume skills: {resume_skills}")
-        print(f"📊 Resume analysis: {resume_metadata.get('experience_level', 'unknown')} level")
+        logger.debug("🔍 Extracted resume skills: %s", resume_skills)
+        logger.info("📊 Resume analysis: %s level", resume_metadata.get('experience_level', 'unknown'))
         
+        # Lowercase once for the matcher
+        resume_text_lower = resume_text.lower()
+
         # Validate resume content
-        if resume_text and not is_valid_resume(resume_text):
+        if not resume_is_valid:
             return templates.TemplateResponse("dashboard.html", {
                 "request": request,
                 "results": None,
@@ -331,17 +831,17 @@ async def match_resume(request: Request, resume: UploadFile = File(...)):
 
         # Get jobs from cache or scrape
         try:
-            print("🌐 Fetching internship opportunities...")
-            jobs = await get_jobs_with_cache()
+            logger.info("🌐 Fetching internship opportunities...")
+            jobs = await jobs_task
             if not jobs:
                 return templates.TemplateResponse("dashboard.html", {
                     "request": request,
                     "results": None,
                     "error": "Unable to fetch internship opportunities at this time. Please try again later."
                 })
-            print(f"📋 Total jobs available: {len(jobs)}")
+            logger.info("📋 Total jobs available: %d", len(jobs))
         except Exception as e:
-            print(f"❌ Error fetching jobs: {e}")
+            logger.error("❌ Error fetching jobs: %s", e)
             return templates.TemplateResponse("dashboard.html", {
                 "request": request,
                 "results": None,
@@ -350,17 +850,19 @@ async def match_resume(request: Request, resume: UploadFile = File(...)):
 
         # Match resume to jobs
         try:
-            print("🎯 Starting job matching...")
-            matched_jobs = match_resume_to_jobs(resume_skills, jobs, resume_text)
+            logger.info("🎯 Starting job matching...")
+            matched_jobs = await match_resume_cached(
+                file_digest, "llm", resume_skills, jobs, resume_text, resume_text_lower
+            )
             if not matched_jobs:
                 return templates.TemplateResponse("dashboard.html", {
                     "request": request,
                     "results": None,
                     "error": "No matching internship opportunities were found for your skills. Consider updating your resume with more relevant technical skills."
                 })
-            print(f"✅ Final matched jobs: {len(matched_jobs)}")
+            logger.info("✅ Final matched jobs: %d", len(matched_jobs))
         except Exception as e:
-            print(f"❌ Error matching jobs: {e}")
+            logger.error("❌ Error matching jobs: %s", e)
             return templates.TemplateResponse("dashboard.html", {
                 "request": request,
                 "results": None,
@@ -375,9 +877,7 @@ async def match_resume(request: Request, resume: UploadFile = File(...)):
         })
 
     except Exception as e:
-        print(f"❌ Unexpected error in match_resume: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Unexpected error in match_resume: %s", e)
         return templates.TemplateResponse("dashboard.html", {
             "request": request,
             "results": None,
@@ -386,7 +886,7 @@ async def match_resume(request: Request, resume: UploadFile = File(...)):
 
 
 @app.post("/api/match")
-async def api_match_resume(resume: UploadFile = File(...), think_deeper: str = Form("true")):
+async def api_match_resume(request: Request, resume: UploadFile = File(...), think_deeper: str = Form("true")):
     """API endpoint for React frontend - returns JSON instead of HTML"""
     try:
         # Validate file
@@ -394,73 +894,75 @@ async def api_match_resume(resume: UploadFile = File(...), think_deeper: str = F
             raise HTTPException(status_code=400, detail="No file was uploaded. Please select a resume file.")
 
         # Check file extension
-        file_extension = resume.filename.split('.')[-1].lower() if resume.filename else ''
-        allowed_extensions = ['pdf', 'png', 'jpg', 'jpeg']
-        
-        if file_extension not in allowed_extensions:
+        file_extension = get_file_extension(resume.filename)
+        if file_extension not in ALLOWED_EXTENSIONS:
             raise HTTPException(
-                status_code=400, 
+                status_code=415,
                 detail=f"Invalid file type '{file_extension}'. Please upload a PDF, PNG, JPG, or JPEG file."
             )
 
+        if not await has_valid_signature(resume, file_extension):
+            raise HTTPException(
+                status_code=415,
+                detail=f"The uploaded file is not a valid {file_extension.upper()} file."
+            )
+
         # Read file content
         try:
-            file_content = await resume.read()
+            file_content, file_digest = await read_upload(resume)
             if not file_content:
                 raise HTTPException(status_code=400, detail="The uploaded file appears to be empty. Please upload a valid resume file.")
+        except HTTPException:
+            raise
         except Exception as e:
-            print(f"❌ Error reading file: {e}")
+            logger.error("❌ Error reading file: %s", e)
             raise HTTPException(status_code=400, detail=f"Error reading the uploaded file: {str(e)}")
 
-        print(f"📥 Uploaded: {resume.filename}")
-        print(f"📊 File size: {len(file_content)} bytes")
-        print(f"🔍 File type: {resume.content_type}")
+        logger.info("📥 Uploaded: %s", resume.filename)
+        logger.info("📊 File size: %d bytes", len(file_content))
+        logger.info("🔍 File type: %s", resume.content_type)
 
-        # Upload file to S3
+        # Load jobs while the resume is uploaded and parsed
+        jobs_task = prefetch_jobs()
+
+        # Upload file to S3 (kept for the record; parsing uses the bytes already in memory)
         s3_key = None
         try:
-            print("☁️ Uploading resume to S3...")
-            s3_key = upload_resume_to_s3(file_content, resume.filename)
-            print(f"✅ Resume uploaded to S3: {s3_key}")
+            logger.info("☁️ Uploading resume to S3...")
+            s3_key = await asyncio.to_thread(upload_resume_to_s3, file_content, resume.filename)
+            logger.info("✅ Resume uploaded to S3: %s", s3_key)
         except Exception as e:
-            print(f"❌ S3 upload failed: {e}")
+            logger.error("❌ S3 upload failed: %s", e)
             raise HTTPException(status_code=500, detail=f"Failed to upload resume: {str(e)}")
 
-        # Download file from S3 for processing
-        try:
-            print("📥 Downloading resume from S3 for processing...")
-            downloaded_content, original_filename = download_resume_from_s3(s3_key)
-            print(f"✅ Downloaded {len(downloaded_content)} bytes from S3")
-        except Exception as e:
-            print(f"❌ S3 download failed: {e}")
-            # Clean up S3 file if download fails
-            if s3_key:
-                delete_resume_from_s3(s3_key)
-            raise HTTPException(status_code=500, detail=f"Failed to process resume: {str(e)}")
-
         # Parse resume using selected method (returns skills, text, and metadata)
         try:
             use_llm = think_deeper.lower() == "true"
             if use_llm:
-                print("📄 Step 1/4: Analyzing your resume with AI (GPT-5)...")
+                logger.info("📄 Step 1/4: Analyzing your resume with AI (GPT-5)...")
             else:
-                print("📄 Step 1/4: Analyzing your resume with text-based parsing...")
-            resume_skills, resume_text, resume_metadata = parse_resume(downloaded_content, original_filename, use_llm)
+                logger.info("📄 Step 1/4: Analyzing your resume with text-based parsing...")
+            (resume_skills, resume_text, resume_metadata), resume_is_valid = await parse_resume_cached(
+                file_content, resume.filename, file_digest, use_llm
+            )
             if not resume_skills:
                 raise HTTPException(
                     status_code=400, 
                     detail="No skills were detected in your resume. Please make sure your resume includes technical skills, programming languages, or relevant experience."
                 )
         except Exception as e:
-            print(f"❌ Error parsing resume: {e}")
+            logger.error("❌ Error parsing resume: %s", e)
             raise HTTPException(status_code=400, detail=f"Error parsing your resume: {str(e)}")
 
-        print(f"✅ Step 1 complete: Extracted {len(resume_skills)} skills from resume")
-        print(f"🔍 Skills found: {resume_skills}")
-        print(f"📊 Candidate level: {resume_metadata.get('experience_level', 'unknown')}")
+        logger.info("✅ Step 1 complete: Extracted %d skills from resume", len(resume_skills))
+        logger.info("🔍 Skills found: %s", resume_skills)
+        logger.info("📊 Candidate level: %s", resume_metadata.get('experience_level', 'unknown'))
         
+        # Lowercase once for the matcher
+        resume_text_lower = resume_text.lower()
+
         # Validate resume content
-        if resume_text and not is_valid_resume(resume_text):
+        if not resume_is_valid:
             raise HTTPException(
                 status_code=400, 
                 detail="The uploaded file does not appear to be a valid resume. Please upload a document that contains relevant professional information."
@@ -468,70 +970,74 @@ async def api_match_resume(resume: UploadFile = File(...), think_deeper: str = F
 
         # Get jobs from cache or scrape
         try:
-            print("🌐 Step 2/4: Fetching internship opportunities...")
-            jobs = await get_jobs_with_cache()
+            logger.info("🌐 Step 2/4: Fetching internship opportunities...")
+            jobs = await jobs_task
             if not jobs:
                 raise HTTPException(
                     status_code=500, 
                     detail="Unable to fetch internship opportunities at this time. Please try again later."
                 )
-            print(f"✅ Step 2 complete: Found {len(jobs)} internship opportunities")
+            logger.info("✅ Step 2 complete: Found %d internship opportunities", len(jobs))
         except Exception as e:
-            print(f"❌ Error fetching jobs: {e}")
+            logger.error("❌ Error fetching jobs: %s", e)
             raise HTTPException(status_code=500, detail=f"Error fetching internship opportunities: {str(e)}")
 
         # Match resume to jobs with intelligent prefiltering
         try:
-            print("🤖 Step 3/4: Analyzing job requirements with AI...")
-            print(f"🔍 Your skills: {resume_skills}")
-            print(f"📊 Intelligent prefiltering will select top 50 jobs from {len(jobs)} total jobs based on your skills")
+            logger.info("🤖 Step 3/4: Analyzing job requirements with AI...")
+            logger.info("🔍 Your skills: %s", resume_skills)
+            logger.info("📊 Intelligent prefiltering will select top 50 jobs from %d total jobs based on your skills", len(jobs))
             
             # Pass ALL jobs - intelligent_prefilter_jobs will filter from 1000s → 50 based on THIS resume's skills
-            print("🎯 Step 4/4: Matching your skills to job requirements...")
-            matched_jobs = match_resume_to_jobs(resume_skills, jobs, resume_text)
+            logger.info("🎯 Step 4/4: Matching your skills to job requirements...")
+            matched_jobs = await match_resume_cached(
+                file_digest, "llm" if use_llm else "text", resume_skills, jobs, resume_text, resume_text_lower
+            )
             
-            print(f"✅ Matching complete: Found {len(matched_jobs)} relevant opportunities")
+            logger.info("✅ Matching complete: Found %d relevant opportunities", len(matched_jobs))
             
-            # Filter jobs with score > 0 for the final response
-            jobs_with_matches = [job for job in matched_jobs if job.get('match_score', 0) > 0]
+            # Filter jobs with score > 0 for the final response (the matcher sets match_score on every job)
+            jobs_with_matches = [job for job in matched_jobs if job['match_score'] > 0]
             
             if not jobs_with_matches:
-                # Show all jobs with their scores for debugging
-                print("❌ No jobs with score > 0 - showing all job scores for debugging:")
-                for i, job in enumerate(matched_jobs[:5]):
-                    print(f"   Job {i+1}: {job.get('company')} - {job.get('title')} (Score: {job.get('match_score', 0)})")
-                    print(f"      Skills: {job.get('required_skills', [])}")
+                # Show the top scored jobs for debugging, taken from the unfiltered results
+                debug_jobs = matched_jobs[:5]
+                logger.error("❌ No jobs with score > 0 - showing all job scores for debugging:")
+                for i, job in enumerate(debug_jobs):
+                    logger.info("   Job %d: %s - %s (Score: %s)", i+1, job.get('company'), job.get('title'), job['match_score'])
+                    logger.info("      Skills: %s", job.get('required_skills', []))
                 
-                return JSONResponse(content={
+                return ORJSONResponse(content={
                     "success": True,
                     "message": "No matching internship opportunities were found for your skills. Consider updating your resume with more relevant technical skills.",
-                    "jobs": matched_jobs[:5],  # Return jobs with scores for debugging
+                    "jobs": debug_jobs,  # Return jobs with scores for debugging
                     "skills_found": resume_skills,
                     "debug_info": {
                         "total_jobs_scraped": len(jobs),
-                        "jobs_processed": len(jobs),  # jobs_to_process not defined earlier; using len(jobs)
+                        "jobs_processed": len(matched_jobs),
                         "skills_extracted": len(resume_skills),
-                        "all_job_scores": [{"company": job.get('company'), "title": job.get('title'), "score": job.get('match_score', 0)} for job in matched_jobs[:5]]
+                        "all_job_scores": [{"company": job.get('company'), "title": job.get('title'), "score": job['match_score']} for job in debug_jobs]
                     }
                 })
             
             # Use jobs with matches for the success response
             matched_jobs = jobs_with_matches
-            print(f"✅ Final matched jobs: {len(matched_jobs)}")
+            logger.info("✅ Final matched jobs: %d", len(matched_jobs))
         except Exception as e:
-            print(f"❌ Error matching jobs: {e}")
+            logger.error("❌ Error matching jobs: %s", e)
             raise HTTPException(status_code=500, detail=f"Error matching your resume to jobs: {str(e)}")
 
         # Clean up S3 file after processing
         if s3_key:
             try:
-                delete_resume_from_s3(s3_key)
-                print(f"🗑️ Cleaned up S3 file: {s3_key}")
+                await asyncio.to_thread(delete_resume_from_s3, s3_key)
+                logger.info("🗑️ Cleaned up S3 file: %s", s3_key)
             except Exception as cleanup_error:
-                print(f"⚠️ Failed to clean up S3 file {s3_key}: {cleanup_error}")
+                logger.warning("⚠️ Failed to clean up S3 file %s: %s", s3_key, cleanup_error)
 
-        # Return JSON response for React frontend
-        return JSONResponse(content={
+        # Return JSON response for React frontend (orjson is much faster on the full
+        # job list and serializes the datetime first_seen/last_seen fields natively)
+        return ORJSONResponse(content={
             "success": True,
             "message": f"Found {len(matched_jobs)} matching opportunities!",
             "jobs": matched_jobs,
@@ -542,31 +1048,71 @@ async def api_match_resume(resume: UploadFile = File(...), think_deeper: str = F
         # Clean up S3 file on error
         if 's3_key' in locals() and s3_key:
             try:
-                delete_resume_from_s3(s3_key)
-                print(f"🗑️ Cleaned up S3 file after error: {s3_key}")
+                await asyncio.to_thread(delete_resume_from_s3, s3_key)
+                logger.info("🗑️ Cleaned up S3 file after error: %s", s3_key)
             except Exception as cleanup_error:
-                print(f"⚠️ Failed to clean up S3 file {s3_key}: {cleanup_error}")
+                logger.warning("⚠️ Failed to clean up S3 file %s: %s", s3_key, cleanup_error)
         raise
     except Exception as e:
         # Clean up S3 file on unexpected error
         if 's3_key' in locals() and s3_key:
             try:
-                delete_resume_from_s3(s3_key)
-                print(f"🗑️ Cleaned up S3 file after error: {s3_key}")
+                await asyncio.to_thread(delete_resume_from_s3, s3_key)
+                logger.info("🗑️ Cleaned up S3 file after error: %s", s3_key)
             except Exception as cleanup_error:
-                print(f"⚠️ Failed to clean up S3 file {s3_key}: {cleanup_error}")
+                logger.warning("⚠️ Failed to clean up S3 file %s: %s", s3_key, cleanup_error)
         
-        print(f"❌ Unexpected error in api_match_resume: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Unexpected error in api_match_resume: %s", e)
         raise HTTPException(
             status_code=500, 
             detail=f"An unexpected error occurred: {str(e)}. Please try again or contact support if the problem persists."
         )
 
 
+# Server-sent events must reach the browser as they are produced: no caching, and
+# X-Accel-Buffering tells nginx not to buffer the response
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+
+def sse_event(payload):
+    """
+    Encode one server-sent event. orjson produces the bytes StreamingResponse sends
+    as is; the options match ORJSONResponse, so events accept the same payloads.
+    """
+    return b"data: " + orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) + b"\n\n"
+
+
+def _iso_timestamp(value):
+    """Timestamps may be datetimes (database) or strings (Redis); send strings either way"""
+    if value and hasattr(value, 'isoformat'):
+        return value.isoformat()
+    if value and not isinstance(value, str):
+        return str(value)
+    return value
+
+
+def format_stream_job(job):
+    """Pick the fields the results page renders from a matched job, in one dict per job"""
+    return {
+        'company': job.get('company', 'Unknown'),
+        'title': job.get('title', 'Unknown'),
+        'location': job.get('location', 'Unknown'),
+        'apply_link': job.get('apply_link', '#'),
+        'match_score': job.get('match_score', 0),
+        'match_description': job.get('match_description', ''),
+        'ai_reasoning': job.get('ai_reasoning'),  # Include AI reasoning data
+        'required_skills': job.get('required_skills', []),
+        'first_seen': _iso_timestamp(job.get('first_seen')),
+        'last_seen': _iso_timestamp(job.get('last_seen'))
+    }
+
+
 @app.post("/api/match-stream")
-async def stream_match_resume(resume: UploadFile = File(...), think_deeper: str = Form("true")):
+async def stream_match_resume(request: Request, resume: UploadFile = File(...), think_deeper: str = Form("true")):
     """Streaming endpoint that provides real-time progress updates"""
     
     # IMPORTANT: Read all file data BEFORE the generator function
@@ -575,289 +1121,223 @@ async def stream_match_resume(resume: UploadFile = File(...), think_deeper: str
         # Validate file
         if not resume:
             async def error_response():
-                yield f"data: {json.dumps({'error': 'No file was uploaded'})}\n\n"
+                yield sse_event({'error': 'No file was uploaded'})
             return StreamingResponse(
                 error_response(),
-                media_type="text/plain",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "Content-Type": "text/event-stream",
-                }
+                media_type="text/event-stream",
+                headers=SSE_HEADERS
             )
 
-        file_extension = resume.filename.split('.')[-1].lower() if resume.filename else ''
-        allowed_extensions = ['pdf', 'png', 'jpg', 'jpeg']
-        
-        if file_extension not in allowed_extensions:
+        file_extension = get_file_extension(resume.filename)
+        if file_extension not in ALLOWED_EXTENSIONS:
+            async def error_response():
+                yield sse_event({'error': f'Invalid file type: {file_extension}'})
+            return StreamingResponse(
+                error_response(),
+                media_type="text/event-stream",
+                headers=SSE_HEADERS
+            )
+
+        # Reject mislabelled uploads before reading the body
+        if not await has_valid_signature(resume, file_extension):
+            upload_error = f"The uploaded file is not a valid {file_extension.upper()} file."
             async def error_response():
-                yield f"data: {json.dumps({'error': f'Invalid file type: {file_extension}'})}\n\n"
+                yield sse_event({'error': upload_error})
             return StreamingResponse(
                 error_response(),
-                media_type="text/plain",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "Content-Type": "text/event-stream",
-                }
+                media_type="text/event-stream",
+                headers=SSE_HEADERS
             )
 
         # Read file content ONCE, before the generator
-        file_content = await resume.read()
+        file_content, file_digest = await read_upload(resume)
         filename = resume.filename
         content_type = resume.content_type
         
         if not file_content:
             async def error_response():
-                yield f"data: {json.dumps({'error': 'Empty file uploaded'})}\n\n"
+                yield sse_event({'error': 'Empty file uploaded'})
             return StreamingResponse(
                 error_response(),
-                media_type="text/plain",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "Content-Type": "text/event-stream",
-                }
+                media_type="text/event-stream",
+                headers=SSE_HEADERS
             )
 
         # Upload file to S3 ONCE, before the generator
         try:
-            s3_key = upload_resume_to_s3(file_content, filename)
-            print(f"✅ Stream: Resume uploaded to S3: {s3_key}")
+            s3_key = await asyncio.to_thread(upload_resume_to_s3, file_content, filename)
+            logger.info("✅ Stream: Resume uploaded to S3: %s", s3_key)
         except Exception as e:
-            print(f"❌ Stream: S3 upload failed: {e}")
+            logger.error("❌ Stream: S3 upload failed: %s", e)
             async def error_response():
-                yield f"data: {json.dumps({'error': f'S3 upload failed: {str(e)}'})}\n\n"
+                yield sse_event({'error': f'S3 upload failed: {str(e)}'})
             return StreamingResponse(
                 error_response(),
-                media_type="text/plain",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "Content-Type": "text/event-stream",
-                }
+                media_type="text/event-stream",
+                headers=SSE_HEADERS
             )
+    except HTTPException as e:
+        upload_error = e.detail
+        async def error_response():
+            yield sse_event({'error': upload_error})
+        return StreamingResponse(
+            error_response(),
+            media_type="text/event-stream",
+            headers=SSE_HEADERS
+        )
     except Exception as e:
         async def error_response():
-            yield f"data: {json.dumps({'error': f'File upload error: {str(e)}'})}\n\n"
+            yield sse_event({'error': f'File upload error: {str(e)}'})
         return StreamingResponse(
             error_response(),
-            media_type="text/plain",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "Content-Type": "text/event-stream",
-            }
+            media_type="text/event-stream",
+            headers=SSE_HEADERS
         )
     
     async def generate_progress():
         try:
             # Convert think_deeper parameter to boolean
             use_llm = think_deeper.lower() == "true"
+            # Load jobs while the resume is parsed
+            jobs_task = prefetch_jobs()
             
-            yield f"data: {json.dumps({'step': 1, 'message': 'File uploaded to S3 successfully', 'progress': 10})}\n\n"
-
-            # Download file from S3 for processing
-            try:
-                yield f"data: {json.dumps({'step': 2, 'message': 'Downloading resume from S3...', 'progress': 15})}\n\n"
-                downloaded_content, original_filename = download_resume_from_s3(s3_key)
-                yield f"data: {json.dumps({'step': 3, 'message': 'Resume downloaded successfully', 'progress': 20})}\n\n"
-            except Exception as e:
-                yield f"data: {json.dumps({'error': f'S3 download failed: {str(e)}'})}\n\n"
-                return
+            yield sse_event({'step': 1, 'message': 'File uploaded to S3 successfully', 'progress': 10})
 
             # Step 3: Parse resume using selected method
             if use_llm:
-                yield f"data: {json.dumps({'step': 4, 'message': 'Analyzing your resume with AI (GPT-5)...', 'progress': 25})}\n\n"
+                yield sse_event({'step': 4, 'message': 'Analyzing your resume with AI (GPT-5)...', 'progress': 25})
             else:
-                yield f"data: {json.dumps({'step': 4, 'message': 'Analyzing your resume with text-based parsing...', 'progress': 25})}\n\n"
+                yield sse_event({'step': 4, 'message': 'Analyzing your resume with text-based parsing...', 'progress': 25})
             
             try:
-                resume_skills, resume_text, resume_metadata = parse_resume(downloaded_content, original_filename, use_llm)
+                (resume_skills, resume_text, resume_metadata), _ = await parse_resume_cached(
+                    file_content, filename, file_digest, use_llm
+                )
                 if not resume_skills:
-                    yield f"data: {json.dumps({'error': 'No skills detected in resume'})}\n\n"
+                    yield sse_event({'error': 'No skills detected in resume'})
                     return
                 
+                resume_text_lower = resume_text.lower()
                 exp_level = resume_metadata.get('experience_level', 'unknown')
-                yield f"data: {json.dumps({'step': 5, 'message': f'Found {len(resume_skills)} skills - {exp_level} level', 'skills': resume_skills, 'progress': 40})}\n\n"
+                yield sse_event({'step': 5, 'message': f'Found {len(resume_skills)} skills - {exp_level} level', 'skills': resume_skills, 'progress': 40})
                 
             except Exception as e:
-                yield f"data: {json.dumps({'error': f'Resume parsing failed: {str(e)}'})}\n\n"
+                yield sse_event({'error': f'Resume parsing failed: {str(e)}'})
                 # Clean up S3 file on error
                 try:
-                    delete_resume_from_s3(s3_key)
+                    await asyncio.to_thread(delete_resume_from_s3, s3_key)
                 except:
                     pass
                 return
 
             # Step 6: Get jobs from cache or scrape
-            yield f"data: {json.dumps({'step': 6, 'message': 'Loading internship opportunities...', 'progress': 50})}\n\n"
+            yield sse_event({'step': 6, 'message': 'Loading internship opportunities...', 'progress': 50})
             
             try:
-                jobs = await get_jobs_with_cache()
+                jobs = await jobs_task
                 if not jobs:
-                    yield f"data: {json.dumps({'error': 'No jobs found'})}\n\n"
+                    yield sse_event({'error': 'No jobs found'})
                     # Clean up S3 file on error
                     try:
-                        delete_resume_from_s3(s3_key)
+                        await asyncio.to_thread(delete_resume_from_s3, s3_key)
                     except:
                         pass
                     return
                     
-                yield f"data: {json.dumps({'step': 7, 'message': f'Found {len(jobs)} internship opportunities', 'progress': 60})}\n\n"
+                yield sse_event({'step': 7, 'message': f'Found {len(jobs)} internship opportunities', 'progress': 60})
                 
             except Exception as e:
-                yield f"data: {json.dumps({'error': f'Job loading failed: {str(e)}'})}\n\n"
+                yield sse_event({'error': f'Job loading failed: {str(e)}'})
                 # Clean up S3 file on error
                 try:
-                    delete_resume_from_s3(s3_key)
+                    await asyncio.to_thread(delete_resume_from_s3, s3_key)
                 except:
                     pass
                 return
 
             # Step 8: Use intelligent prefiltering + batch LLM matching
-            yield f"data: {json.dumps({'step': 8, 'message': f'Intelligently filtering from {len(jobs)} jobs based on your skills...', 'progress': 70})}\n\n"
+            yield sse_event({'step': 8, 'message': f'Intelligently filtering from {len(jobs)} jobs based on your skills...', 'progress': 70})
             
             try:
                 # Pass ALL jobs - intelligent prefiltering will select top 50 for THIS resume
-                matched_jobs = match_resume_to_jobs(resume_skills, jobs, resume_text)
-                
-                yield f"data: {json.dumps({'step': 9, 'message': 'Deep career fit analysis in progress...', 'progress': 85})}\n\n"
-                
-                # Convert to the format expected by frontend
-                formatted_jobs = []
-                for job in matched_jobs:
-                    # Handle timestamp conversion - could be datetime or string
-                    first_seen = job.get('first_seen')
-                    last_seen = job.get('last_seen')
-
-                    # Convert to ISO string if datetime object
-                    if first_seen and hasattr(first_seen, 'isoformat'):
-                        first_seen = first_seen.isoformat()
-                    elif first_seen and not isinstance(first_seen, str):
-                        first_seen = str(first_seen)
-
-                    if last_seen and hasattr(last_seen, 'isoformat'):
-                        last_seen = last_seen.isoformat()
-                    elif last_seen and not isinstance(last_seen, str):
-                        last_seen = str(last_seen)
-
-                    job_result = {
-                        'company': job.get('company', 'Unknown'),
-                        'title': job.get('title', 'Unknown'),
-                        'location': job.get('location', 'Unknown'),
-                        'apply_link': job.get('apply_link', '#'),
-                        'match_score': job.get('match_score', 0),
-                        'match_description': job.get('match_description', ''),
-                        'ai_reasoning': job.get('ai_reasoning'),  # Include AI reasoning data
-                        'required_skills': job.get('required_skills', []),
-                        'first_seen': first_seen,
-                        'last_seen': last_seen
-                    }
-                    formatted_jobs.append(job_result)
+                matched_jobs = await match_resume_cached(
+                    file_digest, "llm" if use_llm else "text", resume_skills, jobs, resume_text, resume_text_lower
+                )
                 
-                jobs_with_matches = [job for job in formatted_jobs if job['match_score'] > 0]
+                yield sse_event({'step': 9, 'message': 'Deep career fit analysis in progress...', 'progress': 85})
                 
+                # Only the count is reported, so count in one pass instead of building a list
+                matches_found = sum(1 for job in matched_jobs if job.get('match_score', 0) > 0)
+
                 # For think deeper mode: return all results since LLM processed all jobs
-                # For regular mode: limit to 10 results for speed
-                if use_llm:
-                    final_results = formatted_jobs  # Return all LLM-analyzed jobs
-                else:
-                    final_results = formatted_jobs[:10] if len(formatted_jobs) >= 10 else formatted_jobs
+                # For regular mode: only the top results are shown, so select them before formatting
+                if not use_llm:
+                    matched_jobs = heapq.nlargest(QUICK_MODE_RESULT_LIMIT, matched_jobs, key=lambda job: job.get('match_score', 0))
+
+                # Convert to the format expected by frontend
+                final_results = [format_stream_job(job) for job in matched_jobs]
                 
                 # Debug logging
-                print(f"🔍 Streaming final results: {len(final_results)} jobs")
-                for i, job in enumerate(final_results):
-                    print(f"   Job {i+1}: {job['company']} - {job['title']} (Score: {job['match_score']})")
+                logger.info("🔍 Streaming final results: %d jobs", len(final_results))
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, job in enumerate(final_results):
+                        logger.debug("   Job %d: %s - %s (Score: %s)", i+1, job['company'], job['title'], job['match_score'])
                 
                 # Update completion message based on mode and results
                 if use_llm:
-                    completion_message = f'Think Deeper analysis complete! Found {len(jobs_with_matches)} matches out of {len(final_results)} jobs analyzed.'
+                    completion_message = f'Think Deeper analysis complete! Found {matches_found} matches out of {len(final_results)} jobs analyzed.'
                 else:
                     completion_message = f'Quick matching complete! Showing top {len(final_results)} results.'
                 
                 # Clean up S3 file after successful processing
                 try:
-                    delete_resume_from_s3(s3_key)
-                    print(f"🗑️ Stream: Cleaned up S3 file: {s3_key}")
+                    await asyncio.to_thread(delete_resume_from_s3, s3_key)
+                    logger.info("🗑️ Stream: Cleaned up S3 file: %s", s3_key)
                 except Exception as cleanup_error:
-                    print(f"⚠️ Stream: Failed to clean up S3 file {s3_key}: {cleanup_error}")
+                    logger.warning("⚠️ Stream: Failed to clean up S3 file %s: %s", s3_key, cleanup_error)
 
-                yield f"data: {json.dumps({'step': 10, 'message': completion_message, 'final_results': final_results, 'matches_found': len(jobs_with_matches), 'total_results': len(final_results), 'progress': 100, 'complete': True})}\n\n"
+                yield sse_event({'step': 10, 'message': completion_message, 'final_results': final_results, 'matches_found': matches_found, 'total_results': len(final_results), 'progress': 100, 'complete': True})
                 
             except Exception as e:
-                print(f"❌ Error in intelligent matching: {e}")
+                logger.error("❌ Error in intelligent matching: %s", e)
                 # Fallback to legacy approach if new system fails
-                yield f"data: {json.dumps({'step': 9, 'message': 'Using fallback matching system...', 'progress': 85})}\n\n"
+                yield sse_event({'step': 9, 'message': 'Using fallback matching system...', 'progress': 85})
                 
-                from matching.matcher import match_resume_to_jobs_legacy
                 # Even in fallback, use intelligent prefiltering - pass all jobs
-                matched_jobs = match_resume_to_jobs_legacy(resume_skills, jobs, resume_text)
+                matched_jobs = await asyncio.to_thread(
+                    match_resume_to_jobs_legacy, resume_skills, jobs, resume_text, resume_text_lower
+                )
+                matches_found = sum(1 for job in matched_jobs if job.get('match_score', 0) > 0)
+
+                # Fallback uses legacy matching - keep the 10 result limit for speed
+                matched_jobs = heapq.nlargest(QUICK_MODE_RESULT_LIMIT, matched_jobs, key=lambda job: job.get('match_score', 0))
                 
                 # Format results
-                formatted_jobs = []
-                for job in matched_jobs:
-                    # Handle timestamp conversion - could be datetime or string
-                    first_seen = job.get('first_seen')
-                    last_seen = job.get('last_seen')
-
-                    # Convert to ISO string if datetime object
-                    if first_seen and hasattr(first_seen, 'isoformat'):
-                        first_seen = first_seen.isoformat()
-                    elif first_seen and not isinstance(first_seen, str):
-                        first_seen = str(first_seen)
-
-                    if last_seen and hasattr(last_seen, 'isoformat'):
-                        last_seen = last_seen.isoformat()
-                    elif last_seen and not isinstance(last_seen, str):
-                        last_seen = str(last_seen)
-
-                    job_result = {
-                        'company': job.get('company', 'Unknown'),
-                        'title': job.get('title', 'Unknown'),
-                        'location': job.get('location', 'Unknown'),
-                        'apply_link': job.get('apply_link', '#'),
-                        'match_score': job.get('match_score', 0),
-                        'match_description': job.get('match_description', ''),
-                        'ai_reasoning': job.get('ai_reasoning'),  # Include AI reasoning data
-                        'required_skills': job.get('required_skills', []),
-                        'first_seen': first_seen,
-                        'last_seen': last_seen
-                    }
-                    formatted_jobs.append(job_result)
-                
-                jobs_with_matches = [job for job in formatted_jobs if job['match_score'] > 0]
-                
-                # Fallback uses legacy matching - keep 10 result limit for speed
-                final_results = formatted_jobs[:10] if len(formatted_jobs) >= 10 else formatted_jobs
+                final_results = [format_stream_job(job) for job in matched_jobs]
                 
                 # Clean up S3 file after fallback processing
                 try:
-                    delete_resume_from_s3(s3_key)
-                    print(f"🗑️ Stream: Cleaned up S3 file after fallback: {s3_key}")
+                    await asyncio.to_thread(delete_resume_from_s3, s3_key)
+                    logger.info("🗑️ Stream: Cleaned up S3 file after fallback: %s", s3_key)
                 except Exception as cleanup_error:
-                    print(f"⚠️ Stream: Failed to clean up S3 file {s3_key}: {cleanup_error}")
+                    logger.warning("⚠️ Stream: Failed to clean up S3 file %s: %s", s3_key, cleanup_error)
 
-                yield f"data: {json.dumps({'step': 10, 'message': 'Matching complete!', 'final_results': final_results, 'matches_found': len(jobs_with_matches), 'total_results': len(final_results), 'progress': 100, 'complete': True})}\n\n"
+                yield sse_event({'step': 10, 'message': 'Matching complete!', 'final_results': final_results, 'matches_found': matches_found, 'total_results': len(final_results), 'progress': 100, 'complete': True})
 
         except Exception as e:
             # Clean up S3 file on unexpected error
             try:
-                delete_resume_from_s3(s3_key)
-                print(f"🗑️ Stream: Cleaned up S3 file after error: {s3_key}")
+                await asyncio.to_thread(delete_resume_from_s3, s3_key)
+                logger.info("🗑️ Stream: Cleaned up S3 file after error: %s", s3_key)
             except Exception as cleanup_error:
-                print(f"⚠️ Stream: Failed to clean up S3 file {s3_key}: {cleanup_error}")
+                logger.warning("⚠️ Stream: Failed to clean up S3 file %s: %s", s3_key, cleanup_error)
             
-            yield f"data: {json.dumps({'error': f'Unexpected error: {str(e)}'})}\n\n"
+            yield sse_event({'error': f'Unexpected error: {str(e)}'})
 
     return StreamingResponse(
         generate_progress(),
-        media_type="text/plain",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Content-Type": "text/event-stream",
-        }
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
     )
 
 
@@ -866,7 +1346,7 @@ async def cache_status():
     """Get comprehensive hybrid cache status and information"""
     cache_info = job_cache.get_cache_info()
     
-    return JSONResponse({
+    return ORJSONResponse({
         "hybrid_cache": cache_info,
         "redis_available": job_cache.is_redis_available(),
         "database_available": job_cache.is_database_available(),
@@ -901,7 +1381,7 @@ async def test_matching():
         ]
         
         # Test matching
-        matched_jobs = match_resume_to_jobs(resume_skills, sample_jobs, resume_text)
+        matched_jobs = await asyncio.to_thread(match_resume_to_jobs, resume_skills, sample_jobs, resume_text)
         
         # Format for frontend
         formatted_jobs = []
@@ -917,7 +1397,7 @@ async def test_matching():
             }
             formatted_jobs.append(job_result)
         
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "message": f"Test completed - found {len(formatted_jobs)} matches",
             "jobs": formatted_jobs,
@@ -930,8 +1410,8 @@ async def test_matching():
         })
         
     except Exception as e:
-        print(f"❌ Test matching error: {e}")
-        return JSONResponse({
+        logger.error("❌ Test matching error: %s", e)
+        return ORJSONResponse({
             "success": False,
             "error": str(e),
             "system_info": {
@@ -952,14 +1432,13 @@ async def refresh_cache(force_full: bool = False, max_days_old: int = 30):
     try:
         scrape_type = "full" if force_full else "smart"
         date_filter_msg = f" (last {max_days_old} days)" if max_days_old else ""
-        print(f"🔄 Manual cache refresh requested ({scrape_type} scrape{date_filter_msg})...")
+        logger.info("🔄 Manual cache refresh requested (%s scrape%s)...", scrape_type, date_filter_msg)
         
         # Clear Redis cache (keep database for deduplication)
-        clear_result = job_cache.clear_cache()
+        clear_result = await asyncio.to_thread(job_cache.clear_cache)
         
         # Perform scraping based on force_full parameter
         if force_full:
-            from job_scrapers.dispatcher import scrape_jobs_full
             jobs = await scrape_jobs_full(max_days_old=max_days_old)
         else:
             # Smart scraping (auto-detects incremental vs full)
@@ -968,9 +1447,9 @@ async def refresh_cache(force_full: bool = False, max_days_old: int = 30):
         if not jobs:
             # If no new jobs in incremental mode, that's okay
             if not force_full:
-                cache_info = job_cache.get_cache_info()
+                cache_info = await asyncio.to_thread(job_cache.get_cache_info)
                 db_jobs = cache_info.get('database', {}).get('active_jobs', 0)
-                return JSONResponse({
+                return ORJSONResponse({
                     "success": True,
                     "message": f"No new jobs found{date_filter_msg}. {db_jobs} jobs already in database",
                     "new_jobs": 0,
@@ -982,9 +1461,11 @@ async def refresh_cache(force_full: bool = False, max_days_old: int = 30):
                 raise HTTPException(status_code=500, detail=f"No jobs scraped in full refresh{date_filter_msg}")
         
         # Store in hybrid cache system
-        cache_result = job_cache.set_cached_jobs(jobs, cache_type='manual_refresh')
+        cache_result = await asyncio.to_thread(job_cache.set_cached_jobs, jobs, cache_type='manual_refresh')
+        # Serve the refreshed jobs right away instead of after the snapshot expires
+        await refresh_jobs_snapshot()
         
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "message": f"Cache refreshed successfully{date_filter_msg}",
             "new_jobs": cache_result.get('new_jobs', 0),
@@ -996,7 +1477,7 @@ async def refresh_cache(force_full: bool = False, max_days_old: int = 30):
             "redis_ttl_hours": job_cache.CACHE_TTL / 3600
         })
     except Exception as e:
-        print(f"❌ Error refreshing cache: {e}")
+        logger.error("❌ Error refreshing cache: %s", e)
         raise HTTPException(status_code=500, detail=f"Cache refresh failed: {str(e)}")
 
 
@@ -1010,14 +1491,15 @@ async def refresh_cache_incremental(max_days_old: int = 30):
     """
     try:
         date_filter_msg = f" (last {max_days_old} days)" if max_days_old else ""
-        print(f"🔄 Incremental cache refresh requested{date_filter_msg}...")
+        logger.info("🔄 Incremental cache refresh requested%s...", date_filter_msg)
         
-        from job_scrapers.dispatcher import scrape_jobs_incremental
         jobs = await scrape_jobs_incremental(max_days_old=max_days_old)
         
-        cache_result = job_cache.set_cached_jobs(jobs, cache_type='incremental_manual')
+        cache_result = await asyncio.to_thread(job_cache.set_cached_jobs, jobs, cache_type='incremental_manual')
+        if cache_result.get('new_jobs'):
+            await refresh_jobs_snapshot()
         
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "message": f"Incremental refresh completed{date_filter_msg}",
             "new_jobs": cache_result.get('new_jobs', 0),
@@ -1027,7 +1509,7 @@ async def refresh_cache_incremental(max_days_old: int = 30):
             "max_days_old": max_days_old
         })
     except Exception as e:
-        print(f"❌ Error in incremental refresh: {e}")
+        logger.error("❌ Error in incremental refresh: %s", e)
         raise HTTPException(status_code=500, detail=f"Incremental refresh failed: {str(e)}")
 
 
@@ -1035,10 +1517,9 @@ async def refresh_cache_incremental(max_days_old: int = 30):
 async def database_stats():
     """Get detailed database statistics"""
     try:
-        from job_database import get_database_stats
         stats = get_database_stats()
         
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "database_stats": stats,
             "available": job_cache.is_database_available()
@@ -1048,4 +1529,6 @@ async def database_stats():
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Multiple workers need the app as an import string; loop/http "auto" pick
+    # uvloop and httptools whenever they are installed
+    uvicorn.run("app:app", host="0.0.0.0", port=8000, workers=WEB_CONCURRENCY, loop="auto", http="auto")
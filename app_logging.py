@@ -0,0 +1,59 @@
+"""
+Non-blocking logging setup for the web app.
+
+Request handlers only put log records on an in-memory queue; a background
+listener thread does the formatting and the writes to stdout, so logging never
+blocks the event loop on I/O.
+"""
+import os
+import sys
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "%(message)s"
+
+_listener = None
+
+
+def configure_logging():
+    """
+    Route all logging through a queue drained by a background thread.
+    The level comes from LOG_LEVEL (default INFO). Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def configure_worker_logging():
+    """
+    Log straight to stdout in a forked worker process. A fork inherits the root
+    QueueHandler but not the listener thread, so records would pile up in a queue
+    nothing drains; workers log little, so writing directly is fine there.
+    """
+    global _listener
+    _listener = None
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logging.getLogger().handlers[:] = [stream_handler]
+
+
+def stop_logging():
+    """Flush any queued records and stop the background listener"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -4,21 +4,36 @@ Job Cache Module - Hybrid Redis + Database caching for scraped jobs
 - Database: Persistent storage with deduplication and historical tracking
 """
 import os
-import json
+import logging
+import orjson
 import redis
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 from job_database import (
     init_database, bulk_insert_jobs, get_active_jobs, 
-    get_new_jobs_since, get_database_stats, record_cache_operation,
+    get_database_stats, record_cache_operation,
     cleanup_old_metadata
 )
 
+logger = logging.getLogger(__name__)
+
+# orjson options matching the old json.dumps(..., default=str) output: datetimes
+# go through str() and non-string dict keys are stringified
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+def _dumps(obj) -> bytes:
+    return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS)
+
 # Redis configuration
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 CACHE_KEY = "internship_jobs_cache"
 CACHE_TTL = 4 * 60 * 60  # 4 hours in seconds (reduced from 24h)
 LAST_SCRAPE_KEY = "last_scrape_time"
+# Parsed resumes shared by every worker, keyed by parsing mode and file content hash
+RESUME_CACHE_KEY_PREFIX = "resume_parse"
+RESUME_CACHE_TTL = 60 * 60  # 1 hour in seconds
+# Claims that let only one of several app worker processes run a given scrape
+SCRAPE_LOCK_KEY_PREFIX = "scrape_lock"
 
 # Initialize Redis client
 redis_client = None
@@ -32,9 +47,9 @@ def init_redis():
     if not database_initialized:
         database_initialized = init_database()
         if database_initialized:
-            print("✅ Database initialized successfully")
+            logger.info("✅ Database initialized successfully")
         else:
-            print("⚠️ Database initialization failed")
+            logger.warning("⚠️ Database initialization failed")
     
     # Initialize Redis
     try:
@@ -47,15 +62,15 @@ def init_redis():
         )
         # Test connection
         redis_client.ping()
-        print("✅ Redis connected successfully")
+        logger.info("✅ Redis connected successfully")
         return True
     except redis.ConnectionError as e:
-        print(f"⚠️ Redis connection failed: {e}")
-        print("📝 Continuing with database only - Redis cache disabled")
+        logger.warning("⚠️ Redis connection failed: %s", e)
+        logger.info("📝 Continuing with database only - Redis cache disabled")
         redis_client = None
         return database_initialized
     except Exception as e:
-        print(f"❌ Redis initialization error: {e}")
+        logger.error("❌ Redis initialization error: %s", e)
         redis_client = None
         return database_initialized
 
@@ -71,13 +86,13 @@ def get_cached_jobs() -> Optional[List[Dict]]:
         try:
             cached_data = redis_client.get(CACHE_KEY)
             if cached_data:
-                jobs = json.loads(cached_data)
-                print(f"⚡ Retrieved {len(jobs)} jobs from Redis cache")
+                jobs = orjson.loads(cached_data)
+                logger.info("⚡ Retrieved %d jobs from Redis cache", len(jobs))
                 return jobs
         except redis.RedisError as e:
-            print(f"⚠️ Redis error while getting cache: {e}")
-        except json.JSONDecodeError as e:
-            print(f"❌ Invalid JSON in Redis cache: {e}")
+            logger.warning("⚠️ Redis error while getting cache: %s", e)
+        except orjson.JSONDecodeError as e:
+            logger.error("❌ Invalid JSON in Redis cache: %s", e)
             # Clear corrupted cache
             try:
                 redis_client.delete(CACHE_KEY)
@@ -89,26 +104,26 @@ def get_cached_jobs() -> Optional[List[Dict]]:
         try:
             jobs = get_active_jobs(limit=10000)  # Get all active jobs
             if jobs:
-                print(f"📦 Retrieved {len(jobs)} jobs from database")
+                logger.info("📦 Retrieved %d jobs from database", len(jobs))
                 
                 # Warm Redis cache if available
                 if redis_client and jobs:
                     try:
-                        jobs_json = json.dumps(jobs, default=str)
+                        jobs_json = _dumps(jobs)
                         redis_client.setex(CACHE_KEY, CACHE_TTL, jobs_json)
-                        print(f"🔄 Warmed Redis cache with {len(jobs)} jobs")
+                        logger.info("🔄 Warmed Redis cache with %d jobs", len(jobs))
                     except Exception as e:
-                        print(f"⚠️ Failed to warm Redis cache: {e}")
+                        logger.warning("⚠️ Failed to warm Redis cache: %s", e)
                 
                 return jobs
             else:
-                print("📝 No active jobs in database")
+                logger.info("📝 No active jobs in database")
                 return None
         except Exception as e:
-            print(f"❌ Database error while getting jobs: {e}")
+            logger.error("❌ Database error while getting jobs: %s", e)
             return None
     
-    print("📝 No cache available - Redis and database both unavailable")
+    logger.info("📝 No cache available - Redis and database both unavailable")
     return None
 
 def set_cached_jobs(jobs: List[Dict], cache_type: str = 'daily') -> Dict:
@@ -144,11 +159,11 @@ def set_cached_jobs(jobs: List[Dict], cache_type: str = 'daily') -> Dict:
                     metadata=db_result
                 )
                 
-                print(f"✅ Database: {summary['new_jobs']} new jobs, {summary['updated_jobs']} updated")
+                logger.info("✅ Database: %s new jobs, %s updated", summary['new_jobs'], summary['updated_jobs'])
             else:
-                print(f"❌ Database error: {db_result['error']}")
+                logger.error("❌ Database error: %s", db_result['error'])
         except Exception as e:
-            print(f"❌ Database error while storing jobs: {e}")
+            logger.error("❌ Database error while storing jobs: %s", e)
     
     # Update Redis cache
     if redis_client:
@@ -157,20 +172,20 @@ def set_cached_jobs(jobs: List[Dict], cache_type: str = 'daily') -> Dict:
             if database_initialized:
                 active_jobs = get_active_jobs(limit=10000)
                 if active_jobs:
-                    jobs_json = json.dumps(active_jobs, default=str)
+                    jobs_json = _dumps(active_jobs)
                     redis_client.setex(CACHE_KEY, CACHE_TTL, jobs_json)
                     summary['redis_success'] = True
-                    print(f"✅ Redis cache updated with {len(active_jobs)} active jobs")
+                    logger.info("✅ Redis cache updated with %d active jobs", len(active_jobs))
             else:
                 # Fallback to original Redis-only approach
-                jobs_json = json.dumps(jobs, default=str)
+                jobs_json = _dumps(jobs)
                 redis_client.setex(CACHE_KEY, CACHE_TTL, jobs_json)
                 summary['redis_success'] = True
-                print(f"✅ Redis cache updated with {len(jobs)} jobs")
+                logger.info("✅ Redis cache updated with %d jobs", len(jobs))
         except redis.RedisError as e:
-            print(f"⚠️ Redis error while setting cache: {e}")
+            logger.warning("⚠️ Redis error while setting cache: %s", e)
         except Exception as e:
-            print(f"❌ Error updating Redis cache: {e}")
+            logger.error("❌ Error updating Redis cache: %s", e)
     
     # Update last scrape time
     if redis_client:
@@ -181,6 +196,50 @@ def set_cached_jobs(jobs: List[Dict], cache_type: str = 'daily') -> Dict:
     
     return summary
 
+def _resume_cache_key(digest: str, use_llm: bool) -> str:
+    return f"{RESUME_CACHE_KEY_PREFIX}:{'llm' if use_llm else 'text'}:{digest}"
+
+def get_resume_cache(digest: str, use_llm: bool = True) -> Optional[Dict]:
+    """
+    Get a parsed resume stored by any worker for this file content hash.
+    Returns a dict with 'skills', 'text', 'metadata' and 'is_valid', or None.
+    """
+    if not redis_client:
+        return None
+    try:
+        cached_data = redis_client.get(_resume_cache_key(digest, use_llm))
+        return orjson.loads(cached_data) if cached_data else None
+    except (redis.RedisError, orjson.JSONDecodeError) as e:
+        logger.warning("⚠️ Error reading cached resume parse: %s", e)
+        return None
+
+def set_resume_cache(digest: str, use_llm: bool, skills: List[str], text: str, metadata: Dict, is_valid: bool) -> bool:
+    """Store a parsed resume for RESUME_CACHE_TTL seconds so other workers can reuse it"""
+    if not redis_client:
+        return False
+    try:
+        payload = _dumps({"skills": skills, "text": text, "metadata": metadata, "is_valid": is_valid})
+        redis_client.setex(_resume_cache_key(digest, use_llm), RESUME_CACHE_TTL, payload)
+        return True
+    except redis.RedisError as e:
+        logger.warning("⚠️ Error caching resume parse: %s", e)
+        return False
+
+def acquire_scrape_lock(name: str, ttl_seconds: int) -> bool:
+    """
+    Claim the named scrape for this process across all workers (Redis SET NX EX).
+    The first caller wins; the claim expires on its own, so a worker that dies
+    mid-scrape doesn't block later ones. Without Redis there is nothing to
+    coordinate through, so the caller always proceeds.
+    """
+    if not redis_client:
+        return True
+    try:
+        return bool(redis_client.set(f"{SCRAPE_LOCK_KEY_PREFIX}:{name}", os.getpid(), nx=True, ex=ttl_seconds))
+    except redis.RedisError as e:
+        logger.warning("⚠️ Redis error while claiming %s scrape: %s", name, e)
+        return True
+
 def get_cache_info() -> Dict:
     """Get comprehensive cache metadata from both Redis and Database"""
     info = {
@@ -196,7 +255,7 @@ def get_cache_info() -> Dict:
             if exists:
                 ttl = redis_client.ttl(CACHE_KEY)
                 cached_data = redis_client.get(CACHE_KEY)
-                job_count = len(json.loads(cached_data)) if cached_data else 0
+                job_count = len(orjson.loads(cached_data)) if cached_data else 0
                 hours_remaining = ttl / 3600 if ttl > 0 else 0
                 
                 info["redis"] = {
@@ -266,9 +325,9 @@ def clear_cache() -> Dict:
             redis_client.delete(CACHE_KEY)
             redis_client.delete(LAST_SCRAPE_KEY)
             result["redis"] = True
-            print("✅ Redis cache cleared successfully")
+            logger.info("✅ Redis cache cleared successfully")
         except redis.RedisError as e:
-            print(f"⚠️ Error clearing Redis cache: {e}")
+            logger.warning("⚠️ Error clearing Redis cache: %s", e)
     
     return result
 
@@ -283,7 +342,7 @@ def should_do_incremental_scrape() -> bool:
     try:
         last_scrape = redis_client.get(LAST_SCRAPE_KEY)
         if not last_scrape:
-            print("📝 No last scrape time - doing full scrape")
+            logger.info("📝 No last scrape time - doing full scrape")
             return False  # Full scrape if never scraped
         
         last_scrape_time = datetime.fromisoformat(last_scrape)
@@ -291,15 +350,15 @@ def should_do_incremental_scrape() -> bool:
         
         # Do full scrape if more than 24 hours since last scrape
         if time_since_scrape > timedelta(hours=24):
-            print(f"📝 Last scrape was {time_since_scrape} ago - doing full scrape")
+            logger.info("📝 Last scrape was %s ago - doing full scrape", time_since_scrape)
             return False
         
         # Do incremental scrape if less than 24 hours
-        print(f"📝 Last scrape was {time_since_scrape} ago - doing incremental scrape")
+        logger.info("📝 Last scrape was %s ago - doing incremental scrape", time_since_scrape)
         return True
         
     except Exception as e:
-        print(f"⚠️ Error checking last scrape time: {e}")
+        logger.warning("⚠️ Error checking last scrape time: %s", e)
         return True  # Default to incremental
 
 def get_new_jobs_only(scraped_jobs: List[Dict]) -> List[Dict]:
@@ -308,7 +367,7 @@ def get_new_jobs_only(scraped_jobs: List[Dict]) -> List[Dict]:
     Uses database to check for existing jobs
     """
     if not database_initialized:
-        print("⚠️ Database not available - returning all jobs")
+        logger.warning("⚠️ Database not available - returning all jobs")
         return scraped_jobs
     
     try:
@@ -343,11 +402,11 @@ def get_new_jobs_only(scraped_jobs: List[Dict]) -> List[Dict]:
             if job_hash not in existing_hashes
         ]
         
-        print(f"🔍 Filtered {len(scraped_jobs)} scraped jobs → {len(new_jobs)} new jobs")
+        logger.info("🔍 Filtered %d scraped jobs → %d new jobs", len(scraped_jobs), len(new_jobs))
         return new_jobs
         
     except Exception as e:
-        print(f"❌ Error filtering new jobs: {e}")
+        logger.error("❌ Error filtering new jobs: %s", e)
         return scraped_jobs  # Return all jobs on error
 
 def get_jobs_for_matching(limit: Optional[int] = None) -> List[Dict]:
@@ -403,9 +462,9 @@ def perform_weekly_cleanup():
     if database_initialized:
         try:
             cleanup_old_metadata(days=30)
-            print("✅ Weekly cleanup completed")
+            logger.info("✅ Weekly cleanup completed")
         except Exception as e:
-            print(f"❌ Weekly cleanup failed: {e}")
+            logger.error("❌ Weekly cleanup failed: %s", e)
 
 # Initialize on import
 init_redis()
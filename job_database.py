@@ -6,7 +6,7 @@ import os
 import hashlib
 import json
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional
 from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
@@ -1,3 +1,3 @@
-from .dispatcher import scrape_jobs, scrape_all_company_sites
+from .dispatcher import scrape_jobs, scrape_all_company_sites, scrape_all_company_sites_async
 
-__all__ = ['scrape_jobs', 'scrape_all_company_sites']
+__all__ = ['scrape_jobs', 'scrape_all_company_sites', 'scrape_all_company_sites_async']
@@ -1,5 +1,21 @@
+import asyncio
+import logging
+import os
+
 from .scrape_github_internships import scrape_github_internships
 
+logger = logging.getLogger(__name__)
+
+# Active job sources as (display name, scraper function).
+# All other scrapers are disabled due to Selenium/WebDriver issues;
+# the GitHub scraper provides comprehensive internship data.
+ENABLED_SCRAPERS = [
+    ("GitHub", scrape_github_internships),
+]
+
+# Upper bound on sources scraped at the same time (keeps us clear of rate limits)
+MAX_CONCURRENT_SCRAPERS = int(os.getenv("MAX_CONCURRENT_SCRAPERS", "8"))
+
 def scrape_all_company_sites(keyword="intern", max_results=10000, incremental=False, max_days_old=None):
     """
     Scrape jobs from all company sites with optional incremental mode and date filtering.
@@ -16,7 +32,7 @@ def scrape_all_company_sites(keyword="intern", max_results=10000, incremental=Fa
     # Use GitHub Internships as the primary source (most reliable)
     scrape_type = "incremental" if incremental else "full"
     date_filter_msg = f" (last {max_days_old} days)" if max_days_old else ""
-    print(f"🌐 [GitHub] Starting {scrape_type} scrape{date_filter_msg} from Summer 2026 Tech Internships repository...")
+    logger.info("🌐 [GitHub] Starting %s scrape%s from Summer 2026 Tech Internships repository...", scrape_type, date_filter_msg)
     
     github_jobs = scrape_github_internships(
         keyword, 
@@ -30,15 +46,56 @@ def scrape_all_company_sites(keyword="intern", max_results=10000, incremental=Fa
     # The GitHub scraper provides comprehensive internship data
     
     if incremental:
-        print(f"📋 Total new jobs scraped: {len(all_jobs)}")
+        logger.info("📋 Total new jobs scraped: %d", len(all_jobs))
     else:
-        print(f"📋 Total jobs scraped: {len(all_jobs)}")
+        logger.info("📋 Total jobs scraped: %d", len(all_jobs))
     
     return all_jobs
 
+async def scrape_all_company_sites_async(keyword="intern", max_results=10000, incremental=False, max_days_old=None):
+    """
+    Async version of scrape_all_company_sites that runs every enabled scraper concurrently.
+    The scrapers are blocking (requests-based), so each one runs in a worker thread
+    and the event loop stays free while they wait on the network.
+    A failing source is logged and skipped instead of failing the whole scrape.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPERS)
+    scrape_type = "incremental" if incremental else "full"
+    date_filter_msg = f" (last {max_days_old} days)" if max_days_old else ""
+
+    async def run_scraper(name, scraper):
+        async with semaphore:
+            logger.info("🌐 [%s] Starting %s scrape%s...", name, scrape_type, date_filter_msg)
+            return await asyncio.to_thread(
+                scraper,
+                keyword,
+                max_results=max_results,
+                incremental=incremental,
+                max_days_old=max_days_old
+            )
+
+    results = await asyncio.gather(
+        *(run_scraper(name, scraper) for name, scraper in ENABLED_SCRAPERS),
+        return_exceptions=True
+    )
+
+    all_jobs = []
+    for (name, _), result in zip(ENABLED_SCRAPERS, results):
+        if isinstance(result, Exception):
+            logger.error("❌ [%s] Scraper failed: %s", name, result)
+            continue
+        all_jobs.extend(result)
+
+    if incremental:
+        logger.info("📋 Total new jobs scraped: %d", len(all_jobs))
+    else:
+        logger.info("📋 Total jobs scraped: %d", len(all_jobs))
+
+    return all_jobs
+
 async def scrape_jobs(keyword="intern", max_results=10000, incremental=None, max_days_old=None):
     """
-    Async wrapper for scrape_all_company_sites with smart incremental detection and date filtering.
+    Async entry point for scraping all company sites with smart incremental detection and date filtering.
     This function is called by the FastAPI app.
     
     Args:
@@ -53,10 +110,10 @@ async def scrape_jobs(keyword="intern", max_results=10000, incremental=None, max
             from job_cache import should_do_incremental_scrape
             incremental = should_do_incremental_scrape()
         except Exception as e:
-            print(f"⚠️ Error detecting incremental mode: {e}")
+            logger.warning("⚠️ Error detecting incremental mode: %s", e)
             incremental = False
     
-    return scrape_all_company_sites(keyword, max_results, incremental=incremental, max_days_old=max_days_old)
+    return await scrape_all_company_sites_async(keyword, max_results, incremental=incremental, max_days_old=max_days_old)
 
 async def scrape_jobs_incremental(keyword="intern", max_results=10000, max_days_old=None):
     """
@@ -67,7 +124,7 @@ async def scrape_jobs_incremental(keyword="intern", max_results=10000, max_days_
         max_results: Maximum number of results to return
         max_days_old: If set, only return jobs posted within this many days
     """
-    return scrape_all_company_sites(keyword, max_results, incremental=True, max_days_old=max_days_old)
+    return await scrape_all_company_sites_async(keyword, max_results, incremental=True, max_days_old=max_days_old)
 
 async def scrape_jobs_full(keyword="intern", max_results=10000, max_days_old=None):
     """
@@ -78,4 +135,4 @@ async def scrape_jobs_full(keyword="intern", max_results=10000, max_days_old=Non
         max_results: Maximum number of results to return
         max_days_old: If set, only return jobs posted within this many days
     """
-    return scrape_all_company_sites(keyword, max_results, incremental=False, max_days_old=max_days_old)
+    return await scrape_all_company_sites_async(keyword, max_results, incremental=False, max_days_old=max_days_old)
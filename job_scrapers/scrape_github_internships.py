@@ -1,17 +1,38 @@
 #!/usr/bin/env python3
 
-import os
 from dotenv import load_dotenv
+import os
+import threading
 import requests
 import re
 from bs4 import BeautifulSoup
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Load environment variables from .env file
 load_dotenv()
 
 GITHUB_INTERNSHIPS_URL = "https://raw.githubusercontent.com/SimplifyJobs/Summer2026-Internships/dev/README.md"
 
+# Concurrent LLM skill extractions while parsing the table (each one waits on the OpenAI API)
+SKILL_EXTRACTION_WORKERS = int(os.getenv("SKILL_EXTRACTION_WORKERS", "16"))
+
+# Seconds to wait on any single HTTP request, so one stalled host can't hold up a scrape
+SCRAPER_REQUEST_TIMEOUT = float(os.getenv("SCRAPER_REQUEST_TIMEOUT", "10"))
+
+# One HTTP session per thread, so repeated requests to GitHub and to the same job
+# sites reuse open connections instead of paying DNS + TCP + TLS each time.
+# requests.Session isn't thread-safe (shared cookie jar and adapters), so the skill
+# extraction threads each get their own instead of sharing one.
+_thread_local = threading.local()
+
+def get_http_session():
+    """Return this thread's HTTP session, creating it on first use"""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
 def scrape_job_details_from_apply_link(apply_link):
     """
     Follow the apply link and extract real job qualifications from the company's job posting page.
@@ -29,7 +50,7 @@ def scrape_job_details_from_apply_link(apply_link):
             'Upgrade-Insecure-Requests': '1',
         }
         
-        response = requests.get(apply_link, headers=headers, timeout=10)
+        response = get_http_session().get(apply_link, headers=headers, timeout=SCRAPER_REQUEST_TIMEOUT)
         response.raise_for_status()
         
         soup = BeautifulSoup(response.text, 'html.parser')
@@ -922,7 +943,7 @@ def scrape_github_internships(keyword="intern", max_results=10000, incremental=F
     
     try:
         # Get the raw markdown content from GitHub
-        response = requests.get(GITHUB_INTERNSHIPS_URL)
+        response = get_http_session().get(GITHUB_INTERNSHIPS_URL, timeout=SCRAPER_REQUEST_TIMEOUT)
         response.raise_for_status()
         
         # Parse the markdown content directly
@@ -1157,8 +1178,7 @@ def parse_date_to_days(date_string):
     
     try:
         # Import datetime for date parsing
-        from datetime import datetime, timedelta
-        import re
+        from datetime import datetime
         
         # Handle relative time formats
         if "today" in date_string or "just now" in date_string:
@@ -1345,27 +1365,40 @@ def parse_internship_table(content, max_results):
                     'days_since_posted': days_since_posted  # Normalized to days for filtering
                 }
                 
-                # Extract skills using LLM from the detailed description
-                try:
-                    extracted_skills = extract_skills_from_job(job)
-                    job['required_skills'] = extracted_skills if extracted_skills else ['Programming', 'Software Development']
-                    date_info = f" (Posted: {date_posted})" if date_posted else ""
-                    print(f"✅ [GitHub] Added job: {company} - {role}{date_info} (Skills: {job['required_skills'][:3]}...)")
-                except Exception as e:
-                    print(f"⚠️ [GitHub] Skill extraction failed for {company} - {role}: {e}")
-                    job['required_skills'] = ['Programming', 'Software Development', 'Computer Science']
-                    date_info = f" (Posted: {date_posted})" if date_posted else ""
-                    print(f"✅ [GitHub] Added job: {company} - {role}{date_info} (Default skills)")
-                
                 jobs.append(job)
                 
             except Exception as e:
                 print(f"⚠️ [GitHub] Error parsing row: {e}")
                 continue
     
+    # Extract skills for all rows concurrently; each extraction blocks on an LLM call,
+    # so doing them one row at a time made the scrape take the sum of every call
+    with ThreadPoolExecutor(max_workers=SKILL_EXTRACTION_WORKERS) as executor:
+        for job, required_skills in zip(jobs, executor.map(extract_required_skills_for_row, jobs)):
+            job['required_skills'] = required_skills
+    
     print(f"📋 [GitHub] Total jobs parsed: {len(jobs)}")
     return jobs
 
+def extract_required_skills_for_row(job):
+    """
+    Extract skills using LLM from the detailed description of a parsed table row,
+    falling back to generic skills if extraction fails.
+    """
+    company = job['company']
+    role = job['title']
+    date_posted = job['date_posted']
+    date_info = f" (Posted: {date_posted})" if date_posted else ""
+    try:
+        extracted_skills = extract_skills_from_job(job)
+        required_skills = extracted_skills if extracted_skills else ['Programming', 'Software Development']
+        print(f"✅ [GitHub] Added job: {company} - {role}{date_info} (Skills: {required_skills[:3]}...)")
+    except Exception as e:
+        print(f"⚠️ [GitHub] Skill extraction failed for {company} - {role}: {e}")
+        required_skills = ['Programming', 'Software Development', 'Computer Science']
+        print(f"✅ [GitHub] Added job: {company} - {role}{date_info} (Default skills)")
+    return required_skills
+
 def generate_detailed_description(company, role, location):
     """
     Generate a detailed description based on company and role.
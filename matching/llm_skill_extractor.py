@@ -3,16 +3,20 @@ LLM-based skill extraction for job descriptions.
 This replaces all hardcoded skill lists with dynamic, AI-powered extraction.
 """
 
-import os
 import json
 import hashlib
+import heapq
+import logging
+from functools import lru_cache
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai_client import get_openai_client
 from typing import List, Dict, Any
 
 # Load environment variables from .env file
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Simple in-memory cache for job skills to avoid re-processing
 _job_skills_cache = {}
 
@@ -27,18 +31,18 @@ def extract_job_skills_with_llm(job_title: str, job_description: str, company: s
     
     # Check cache first
     if cache_key in _job_skills_cache:
-        print(f"🔄 Using cached skills for job: {job_title}")
+        logger.info("🔄 Using cached skills for job: %s", job_title)
         return _job_skills_cache[cache_key]
     
     # If job description is too short, use fallback
     if len(job_description.strip()) < 50:
-        print(f"⚡ Job description too short, using fast fallback for: {job_title}")
+        logger.info("⚡ Job description too short, using fast fallback for: %s", job_title)
         skills = extract_job_skills_fallback(job_title, job_description)
         _job_skills_cache[cache_key] = skills
         return skills
     
     try:
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        client = get_openai_client()
         
         prompt = f"""
 You are an expert job requirements analyzer. Analyze this internship role and extract the SPECIFIC technical skills required.
@@ -97,14 +101,14 @@ Description: {job_description}
         
         # If LLM returned too few skills or generic ones, enhance with role-based inference
         if len(all_skills) < 3 or all(skill.lower() in ['programming', 'algorithms', 'data structures'] for skill in all_skills):
-            print(f"⚡ LLM skills too generic, enhancing with role-based inference...")
+            logger.info("⚡ LLM skills too generic, enhancing with role-based inference...")
             role_skills = infer_skills_from_role_type(job_title, result.get("role_type", "general"))
             # Merge but prioritize LLM skills
             all_skills = list(dict.fromkeys(all_skills + role_skills))  # Remove duplicates, keep order
         
-        print(f"🤖 LLM extracted {len(all_skills)} skills from job: {job_title}")
-        print(f"🤖 Skills: {all_skills}")
-        print(f"🤖 Role: {result.get('role_type', 'unknown')}, Confidence: {result.get('confidence', 'unknown')}")
+        logger.info("🤖 LLM extracted %d skills from job: %s", len(all_skills), job_title)
+        logger.info("🤖 Skills: %s", all_skills)
+        logger.info("🤖 Role: %s, Confidence: %s", result.get('role_type', 'unknown'), result.get('confidence', 'unknown'))
         
         # Cache the result
         _job_skills_cache[cache_key] = all_skills
@@ -112,8 +116,8 @@ Description: {job_description}
         return all_skills
         
     except Exception as e:
-        print(f"❌ Error with LLM job skill extraction: {e}")
-        print("🔄 Falling back to basic text analysis...")
+        logger.error("❌ Error with LLM job skill extraction: %s", e)
+        logger.info("🔄 Falling back to basic text analysis...")
         skills = extract_job_skills_fallback(job_title, job_description)
         _job_skills_cache[cache_key] = skills
         return skills
@@ -202,7 +206,7 @@ def extract_job_skills_fallback(job_title: str, job_description: str) -> List[st
         if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text):
             found_skills.append(skill)
     
-    print(f"🔄 Fallback extracted {len(found_skills)} skills from job: {job_title}")
+    logger.info("🔄 Fallback extracted %d skills from job: %s", len(found_skills), job_title)
     return found_skills
 
 def calculate_skill_similarity(skill1: str, skill2: str) -> float:
@@ -211,7 +215,7 @@ def calculate_skill_similarity(skill1: str, skill2: str) -> float:
     This replaces hardcoded synonym matching with intelligent comparison.
     """
     try:
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        client = get_openai_client()
         
         prompt = f"""
 You are an expert skill-matching system that compares two technical skills and determines how closely related they are.
@@ -349,7 +353,7 @@ Output:
         return result.get("similarity_score", 0.0)
         
     except Exception as e:
-        print(f"❌ Error calculating skill similarity: {e}")
+        logger.error("❌ Error calculating skill similarity: %s", e)
         # Fallback to simple string comparison
         skill1_lower = skill1.lower().strip()
         skill2_lower = skill2.lower().strip()
@@ -368,7 +372,7 @@ def match_skills_dynamically(job_skills: List[str], resume_skills: List[str], th
     """
     matches = []
     
-    print(f"🔍 Dynamic skill matching - Job: {job_skills}, Resume: {resume_skills}")
+    logger.debug("🔍 Dynamic skill matching - Job: %s, Resume: %s", job_skills, resume_skills)
     
     # First try fast exact and partial matching
     for job_skill in job_skills:
@@ -377,7 +381,7 @@ def match_skills_dynamically(job_skills: List[str], resume_skills: List[str], th
         
         for resume_skill in resume_skills:
             # Fast exact match
-            if job_skill.lower().strip() == resume_skill.lower().strip():
+            if normalize_skill(job_skill) == normalize_skill(resume_skill):
                 best_match = resume_skill
                 best_score = 1.0
                 break
@@ -394,40 +398,54 @@ def match_skills_dynamically(job_skills: List[str], resume_skills: List[str], th
                 "resume_skill": best_match,
                 "similarity_score": best_score
             })
-            print(f"✅ Match: {job_skill} ↔ {best_match} (score: {best_score:.2f})")
+            logger.debug("✅ Match: %s ↔ %s (score: %.2f)", job_skill, best_match, best_score)
     
     return matches
 
+# Common synonyms (minimal hardcoded list for speed)
+SKILL_SYNONYMS = {
+    'javascript': ['js', 'javascript', 'ecmascript'],
+    'typescript': ['ts', 'typescript'],
+    'python': ['python', 'python3', 'py'],
+    'machine learning': ['ml', 'machine learning', 'ai', 'artificial intelligence'],
+    'react': ['react', 'reactjs', 'react.js'],
+    'node.js': ['nodejs', 'node.js', 'node'],
+    'sql': ['sql', 'mysql', 'postgresql', 'postgres'],
+    'git': ['git', 'github', 'version control'],
+    'aws': ['aws', 'amazon web services'],
+    'docker': ['docker', 'containerization'],
+}
+
+# Variant -> the synonym groups it belongs to, so a lookup replaces the scan over every group
+_SYNONYM_GROUPS_BY_VARIANT = {}
+for _canonical, _variants in SKILL_SYNONYMS.items():
+    for _variant in _variants:
+        _SYNONYM_GROUPS_BY_VARIANT.setdefault(_variant, set()).add(_canonical)
+
+# The same few thousand skill strings recur across every job and every resume
+SKILL_NORMALIZATION_CACHE_SIZE = 100_000
+
+@lru_cache(maxsize=SKILL_NORMALIZATION_CACHE_SIZE)
+def normalize_skill(skill: str) -> str:
+    """Lowercased, trimmed form of a skill used for comparisons"""
+    return skill.lower().strip()
+
 def calculate_fast_similarity(skill1: str, skill2: str) -> float:
     """
     Fast similarity calculation using string matching instead of LLM.
     This prevents timeouts while still providing good matching.
     """
-    skill1_lower = skill1.lower().strip()
-    skill2_lower = skill2.lower().strip()
+    skill1_lower = normalize_skill(skill1)
+    skill2_lower = normalize_skill(skill2)
     
     # Exact match
     if skill1_lower == skill2_lower:
         return 1.0
     
-    # Common synonyms (minimal hardcoded list for speed)
-    synonyms = {
-        'javascript': ['js', 'javascript', 'ecmascript'],
-        'typescript': ['ts', 'typescript'],
-        'python': ['python', 'python3', 'py'],
-        'machine learning': ['ml', 'machine learning', 'ai', 'artificial intelligence'],
-        'react': ['react', 'reactjs', 'react.js'],
-        'node.js': ['nodejs', 'node.js', 'node'],
-        'sql': ['sql', 'mysql', 'postgresql', 'postgres'],
-        'git': ['git', 'github', 'version control'],
-        'aws': ['aws', 'amazon web services'],
-        'docker': ['docker', 'containerization'],
-    }
-    
     # Check synonyms
-    for canonical, variants in synonyms.items():
-        if skill1_lower in variants and skill2_lower in variants:
-            return 0.95
+    skill1_groups = _SYNONYM_GROUPS_BY_VARIANT.get(skill1_lower)
+    if skill1_groups and not skill1_groups.isdisjoint(_SYNONYM_GROUPS_BY_VARIANT.get(skill2_lower, ())):
+        return 0.95
     
     # Partial matching
     if len(skill1_lower) > 3 and len(skill2_lower) > 3:
@@ -443,7 +461,7 @@ def extract_job_metadata_with_llm(job_title: str, job_description: str, company:
     Extract job metadata (experience level, location preferences, etc.) using LLM.
     """
     try:
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        client = get_openai_client()
         
         prompt = f"""
 Analyze this job posting and extract key metadata for matching purposes.
@@ -498,7 +516,7 @@ Description: {job_description}
         return result
         
     except Exception as e:
-        print(f"❌ Error extracting job metadata: {e}")
+        logger.error("❌ Error extracting job metadata: %s", e)
         return {
             "experience_level": "entry_level",  # Default for internships
             "years_required": 0,
@@ -520,11 +538,11 @@ def analyze_candidate_profile_with_llm(resume_skills: List[str], resume_text: st
     
     # Check cache first
     if cache_key in _candidate_profile_cache:
-        print("🔄 Using cached candidate profile analysis")
+        logger.info("🔄 Using cached candidate profile analysis")
         return _candidate_profile_cache[cache_key]
     
     try:
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        client = get_openai_client()
         
         prompt = f"""
 Analyze this candidate's profile and create a comprehensive summary for job matching.
@@ -578,8 +596,8 @@ Return JSON:
         
         result = json.loads(response.choices[0].message.content)
         
-        print(f"🤖 Analyzed candidate profile: {result.get('experience_level')} {result.get('career_direction')} developer")
-        print(f"🤖 Top skills: {result.get('top_skills', [])}")
+        logger.info("🤖 Analyzed candidate profile: %s %s developer", result.get('experience_level'), result.get('career_direction'))
+        logger.info("🤖 Top skills: %s", result.get('top_skills', []))
         
         # Cache the result
         _candidate_profile_cache[cache_key] = result
@@ -587,7 +605,7 @@ Return JSON:
         return result
         
     except Exception as e:
-        print(f"❌ Error analyzing candidate profile: {e}")
+        logger.error("❌ Error analyzing candidate profile: %s", e)
         # Fallback to basic analysis
         return {
             "top_skills": resume_skills[:8],
@@ -605,7 +623,7 @@ def llm_deep_ranking(candidate_profile: Dict[str, Any], top_jobs: List[Dict[str,
         return []
     
     try:
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        client = get_openai_client()
         
         # Prepare candidate summary
         candidate_summary = f"""
@@ -684,7 +702,7 @@ Focus on COMPATIBILITY and GROWTH, not just skill matching.
         result = json.loads(response.choices[0].message.content)
         rankings = result.get("rankings", [])
         
-        print(f"🤖 LLM deep ranking completed: {len(rankings)} jobs ranked")
+        logger.info("🤖 LLM deep ranking completed: %d jobs ranked", len(rankings))
         
         # Map rankings back to job objects with enhanced descriptions
         ranked_jobs = []
@@ -701,12 +719,12 @@ Focus on COMPATIBILITY and GROWTH, not just skill matching.
                 job['match_description'] = enhanced_description.strip()
                 ranked_jobs.append(job)
         
-        print(f"✅ Returning {len(ranked_jobs)} intelligently ranked jobs")
+        logger.info("✅ Returning %d intelligently ranked jobs", len(ranked_jobs))
         return ranked_jobs
         
     except Exception as e:
-        print(f"❌ Error in LLM deep ranking: {e}")
-        print("🔄 Falling back to score-based ranking")
+        logger.error("❌ Error in LLM deep ranking: %s", e)
+        logger.info("🔄 Falling back to score-based ranking")
         
         # Fallback: return jobs sorted by their existing match scores
-        return sorted(top_jobs, key=lambda x: x.get('match_score', 0), reverse=True)[:10]
+        return heapq.nlargest(10, top_jobs, key=lambda x: x.get('match_score', 0))
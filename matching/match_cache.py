@@ -0,0 +1,47 @@
+"""
+In-process cache of match results, keyed by resume content hash and job snapshot.
+
+Matching the same resume against the same job snapshot repeats the prefilter
+and the batch LLM call for a result the user has already seen (retries, page
+reloads, re-uploads). Entries are tied to the snapshot version, so a job
+refresh makes older results unreachable, and they also expire after a TTL.
+"""
+import time
+import threading
+from collections import OrderedDict
+
+# Number of (resume, snapshot, mode) results kept per worker
+MATCH_CACHE_SIZE = 1024
+# Seconds a cached result may be served
+MATCH_CACHE_TTL = 900
+
+_match_cache = OrderedDict()
+_match_cache_lock = threading.Lock()
+
+
+def get_cached_matches(digest, snapshot_version, mode="llm"):
+    """
+    Look up the matched jobs for this resume hash and job snapshot.
+    Returns the cached list, or None if missing or expired.
+    """
+    key = (digest, snapshot_version, mode)
+    with _match_cache_lock:
+        entry = _match_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, matched_jobs = entry
+        if time.monotonic() - stored_at > MATCH_CACHE_TTL:
+            del _match_cache[key]
+            return None
+        _match_cache.move_to_end(key)
+        return matched_jobs
+
+
+def cache_matches(digest, snapshot_version, matched_jobs, mode="llm"):
+    """Remember the matched jobs for this resume hash and job snapshot"""
+    key = (digest, snapshot_version, mode)
+    with _match_cache_lock:
+        _match_cache[key] = (time.monotonic(), matched_jobs)
+        _match_cache.move_to_end(key)
+        while len(_match_cache) > MATCH_CACHE_SIZE:
+            _match_cache.popitem(last=False)
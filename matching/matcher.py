@@ -1,7 +1,131 @@
 import re
-import os
 import json
-from openai import OpenAI
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from openai_client import get_openai_client
+
+from .skill_index import get_skill_index, top_k_indices
+from .metadata_matcher import (
+    extract_resume_metadata,
+    extract_job_metadata,
+    calculate_metadata_match_score,
+    combine_match_scores
+)
+from .llm_skill_extractor import (
+    match_skills_dynamically,
+    extract_job_skills_with_llm,
+    analyze_candidate_profile_with_llm
+)
+
+logger = logging.getLogger(__name__)
+
+# Prefilter points per required job skill found in the resume, and their cap
+REQUIRED_SKILL_MATCH_POINTS = 6
+REQUIRED_SKILL_MATCH_CAP = 30
+# Per-job LLM scoring calls in flight at once in the legacy fallback matcher
+LEGACY_SCORING_WORKERS = int(os.getenv("LEGACY_SCORING_WORKERS", "8"))
+# Weight of the IDF-weighted skill cosine similarity used to order jobs with equal prefilter scores
+COSINE_TIEBREAK_WEIGHT = 0.5
+
+# Keyword tables used while scoring every job, built once at import
+STUDENT_INDICATORS = (
+    "student", "university", "college", "bachelor", "master", "phd", "degree",
+    "graduation", "academic", "campus", "freshman", "sophomore", "junior", "senior",
+    "undergraduate", "graduate", "thesis", "research", "internship", "co-op"
+)
+
+RECENT_GRADUATE_INDICATORS = (
+    "recent graduate", "new graduate", "entry level", "junior", "0-2 years",
+    "less than 2 years", "first job", "career starter"
+)
+
+EXPERIENCED_INDICATORS = (
+    "senior", "lead", "principal", "staff", "architect", "manager", "director",
+    "5+ years", "10+ years", "extensive experience", "expert", "advanced",
+    "seasoned", "veteran", "leadership", "mentor", "coach", "supervise"
+)
+
+# Experience levels in priority order. A keyword listed under several levels maps to
+# the highest one, because that level wins whenever the keyword is present.
+EXPERIENCE_LEVEL_INDICATORS = (
+    ("experienced", EXPERIENCED_INDICATORS),
+    ("recent_graduate", RECENT_GRADUATE_INDICATORS),
+    ("student", STUDENT_INDICATORS),
+)
+
+def _build_experience_level_lookup():
+    lookup = {}
+    for level, indicators in EXPERIENCE_LEVEL_INDICATORS:
+        for indicator in indicators:
+            lookup.setdefault(indicator, level)
+    return lookup
+
+EXPERIENCE_LEVEL_BY_INDICATOR = _build_experience_level_lookup()
+
+# Every indicator in one pass over the text; the lookahead lets overlapping
+# indicators match and the alternation tries higher-priority levels first
+EXPERIENCE_LEVEL_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(indicator) for indicator in EXPERIENCE_LEVEL_BY_INDICATOR) + "))"
+)
+
+# Senior/experienced requirements that are not suitable for interns/students
+SENIOR_ROLE_INDICATORS = (
+    "senior", "lead", "principal", "staff", "architect", "manager", "director",
+    "10+ years", "12+ years", "15+ years", "20+ years", "extensive experience",
+    "expert", "advanced", "seasoned", "veteran", "senior level", "leadership",
+    "mentor", "coach", "supervise", "manage", "oversee", "strategic"
+)
+
+ENTRY_LEVEL_INDICATORS = (
+    "entry level", "junior", "intern", "student", "recent graduate", "new graduate",
+    "0-2 years", "less than 2 years", "first job", "career starter", "training"
+)
+
+JOB_EXPERIENCE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(\d+)\+?\s*years?\s*experience',
+    r'(\d+)\+?\s*years?\s*in\s*the\s*field',
+    r'(\d+)\+?\s*years?\s*of\s*development',
+    r'(\d+)\+?\s*years?\s*of\s*software',
+    r'(\d+)\+?\s*years?\s*of\s*programming'
+))
+
+SPECIFIC_ROLE_KEYWORDS = ('frontend', 'backend', 'full stack', 'mobile', 'data', 'ml', 'ai', 'devops', 'cloud', 'security')
+TITLE_TECH_KEYWORDS = ('react', 'python', 'java', 'aws', 'kubernetes', 'typescript', 'node', 'angular', 'vue')
+
+FALLBACK_SENIOR_INDICATORS = (
+    "senior", "lead", "principal", "staff", "architect", "manager", "director",
+    "10+ years", "12+ years", "15+ years", "20+ years", "extensive experience",
+    "expert", "advanced", "seasoned", "veteran", "senior level", "leadership"
+)
+
+# "N+ years of experience" style requirements, shared by the fallback scorer and the prefilter
+HIGH_EXPERIENCE_PATTERNS = (
+    re.compile(r'(\d+)\+?\s*years?\s*(?:of\s+)?experience'),
+    re.compile(r'(\d+)\+?\s*years?\s*(?:of\s+)?(?:software|development|programming)')
+)
+
+PREFILTER_SENIOR_TITLE_INDICATORS = ('senior', 'lead', 'principal', 'staff', 'architect', 'manager', 'director')
+
+DOMAIN_KEYWORDS = {
+    'frontend': ('frontend', 'front-end', 'react', 'angular', 'vue', 'javascript', 'html', 'css'),
+    'backend': ('backend', 'back-end', 'server', 'api', 'node', 'python', 'java', 'database'),
+    'fullstack': ('fullstack', 'full-stack', 'full stack'),
+    'mobile': ('mobile', 'ios', 'android', 'react native', 'flutter', 'swift', 'kotlin'),
+    'data': ('data', 'analytics', 'machine learning', 'ai', 'python', 'sql', 'pandas'),
+    'devops': ('devops', 'cloud', 'aws', 'azure', 'docker', 'kubernetes', 'infrastructure')
+}
+
+TOP_TIER_COMPANIES = ('google', 'microsoft', 'amazon', 'apple', 'meta', 'netflix', 'uber', 'airbnb', 'stripe', 'spotify')
+INTERNSHIP_TITLE_INDICATORS = ('intern', 'internship', 'summer', 'co-op', 'new grad', 'entry level')
+
+# Production/impact keywords looked for in the LLM's reasoning for each job
+PRODUCTION_IMPACT_INDICATORS = (
+    'production', 'deployed', 'users', 'live', 'published', 'shipped',
+    'performance', 'scale', 'optimization', 'real-world', 'impact',
+    'metrics', 'revenue', 'intern', 'company', 'team', 'enterprise'
+)
 
 def is_skill_match(job_skill, resume_skill):
     """
@@ -14,47 +138,27 @@ def is_skill_match(job_skill, resume_skill):
     # Simple fallback for backward compatibility
     return job_skill.lower().strip() == resume_skill.lower().strip()
 
-def extract_user_experience_level(resume_skills, resume_text=""):
+def extract_user_experience_level(resume_skills, resume_text="", resume_text_lower=None):
     """
     Extract user's experience level from resume skills and text.
     Returns: 'student', 'recent_graduate', 'entry_level', 'experienced'
     """
-    resume_text_lower = resume_text.lower()
-    
-    # Check for student indicators
-    student_indicators = [
-        "student", "university", "college", "bachelor", "master", "phd", "degree",
-        "graduation", "academic", "campus", "freshman", "sophomore", "junior", "senior",
-        "undergraduate", "graduate", "thesis", "research", "internship", "co-op"
-    ]
-    
-    # Check for recent graduate indicators
-    recent_graduate_indicators = [
-        "recent graduate", "new graduate", "entry level", "junior", "0-2 years",
-        "less than 2 years", "first job", "career starter"
-    ]
-    
-    # Check for experienced indicators
-    experienced_indicators = [
-        "senior", "lead", "principal", "staff", "architect", "manager", "director",
-        "5+ years", "10+ years", "extensive experience", "expert", "advanced",
-        "seasoned", "veteran", "leadership", "mentor", "coach", "supervise"
-    ]
-    
-    # Check resume text for experience indicators
-    for indicator in experienced_indicators:
-        if indicator in resume_text_lower:
+    if resume_text_lower is None:
+        resume_text_lower = resume_text.lower()
+    
+    # Check resume text for experience indicators in a single scan, stopping at
+    # the first indicator of the highest level
+    levels_found = set()
+    for match in EXPERIENCE_LEVEL_PATTERN.finditer(resume_text_lower):
+        level = EXPERIENCE_LEVEL_BY_INDICATOR[match.group(1)]
+        if level == "experienced":
             return "experienced"
+        levels_found.add(level)
     
-    for indicator in recent_graduate_indicators:
-        if indicator in resume_text_lower:
-            return "recent_graduate"
+    if "recent_graduate" in levels_found:
+        return "recent_graduate"
     
-    for indicator in student_indicators:
-        if indicator in resume_text_lower:
-            return "student"
-    
-    # Default to student if no clear indicators
+    # Student indicators, or the default when there are no clear indicators
     return "student"
 
 def analyze_job_requirements(job_title, job_description, required_skills):
@@ -63,45 +167,23 @@ def analyze_job_requirements(job_title, job_description, required_skills):
     """
     text = f"{job_title} {job_description}".lower()
     
-    # Check for senior/experienced requirements
-    senior_indicators = [
-        "senior", "lead", "principal", "staff", "architect", "manager", "director",
-        "10+ years", "12+ years", "15+ years", "20+ years", "extensive experience",
-        "expert", "advanced", "seasoned", "veteran", "senior level", "leadership",
-        "mentor", "coach", "supervise", "manage", "oversee", "strategic"
-    ]
-    
-    # Check for entry-level indicators
-    entry_level_indicators = [
-        "entry level", "junior", "intern", "student", "recent graduate", "new graduate",
-        "0-2 years", "less than 2 years", "first job", "career starter", "training"
-    ]
-    
     # Determine qualification level
     qualification_level = "mid_level"  # default
     
-    for indicator in senior_indicators:
+    for indicator in SENIOR_ROLE_INDICATORS:
         if indicator in text:
             qualification_level = "senior"
             break
     
-    for indicator in entry_level_indicators:
+    for indicator in ENTRY_LEVEL_INDICATORS:
         if indicator in text:
             qualification_level = "entry_level"
             break
     
     # Extract experience requirements
-    experience_patterns = [
-        r'(\d+)\+?\s*years?\s*experience',
-        r'(\d+)\+?\s*years?\s*in\s*the\s*field',
-        r'(\d+)\+?\s*years?\s*of\s*development',
-        r'(\d+)\+?\s*years?\s*of\s*software',
-        r'(\d+)\+?\s*years?\s*of\s*programming'
-    ]
-    
     required_years = 0
-    for pattern in experience_patterns:
-        matches = re.findall(pattern, text)
+    for pattern in JOB_EXPERIENCE_PATTERNS:
+        matches = pattern.findall(text)
         for match in matches:
             try:
                 years = int(match)
@@ -115,46 +197,39 @@ def analyze_job_requirements(job_title, job_description, required_skills):
         "required_skills": required_skills
     }
 
-def match_job_to_resume(job, resume_skills, resume_text=""):
+def match_job_to_resume(job, resume_skills, resume_text="", resume_text_lower=None,
+                        resume_metadata=None, user_experience=None):
     """
     Match a job to resume skills with comprehensive analysis including metadata.
+    When matching many jobs, pass resume_text_lower, resume_metadata and
+    user_experience so the resume-only analysis runs once instead of once per job.
     Returns: (score, description)
     """
-    from .metadata_matcher import (
-        extract_resume_metadata, 
-        extract_job_metadata, 
-        calculate_metadata_match_score,
-        combine_match_scores
-    )
-    
     job_skills = job.get("required_skills", [])
     job_title = job.get("title", "").lower()
     job_description = job.get("description", "").lower()
     job_location = job.get("location", "").lower()
     
+    if resume_text_lower is None:
+        resume_text_lower = resume_text.lower()
+
     # Extract metadata from resume and job
-    resume_metadata = extract_resume_metadata(resume_skills, resume_text)
+    if resume_metadata is None:
+        resume_metadata = extract_resume_metadata(resume_skills, resume_text, resume_text_lower)
     job_metadata = extract_job_metadata(job)
     
     # Calculate metadata match score
     metadata_score, metadata_description = calculate_metadata_match_score(resume_metadata, job_metadata)
     
     # Analyze user's experience level
-    user_experience = extract_user_experience_level(resume_skills, resume_text)
+    if user_experience is None:
+        user_experience = extract_user_experience_level(resume_skills, resume_text, resume_text_lower)
     
     # Analyze job requirements
     requirements = analyze_job_requirements(job_title, job_description, job_skills)
     
-    # Check for senior/experienced requirements that are not suitable for interns/students
-    senior_indicators = [
-        "senior", "lead", "principal", "staff", "architect", "manager", "director",
-        "10+ years", "12+ years", "15+ years", "20+ years", "extensive experience",
-        "expert", "advanced", "seasoned", "veteran", "senior level", "leadership",
-        "mentor", "coach", "supervise", "manage", "oversee", "strategic"
-    ]
-    
     # Check if job title or description indicates senior/experienced role
-    for indicator in senior_indicators:
+    for indicator in SENIOR_ROLE_INDICATORS:
         if indicator in job_title or indicator in job_description:
             return 0, f"❌ This position requires senior-level experience ({indicator}). Not suitable for {user_experience} candidates."
     
@@ -172,10 +247,8 @@ def match_job_to_resume(job, resume_skills, resume_text=""):
         return 0, "❌ Unable to determine required skills for this position."
 
     # Use dynamic LLM-based skill matching instead of hardcoded logic
-    from matching.llm_skill_extractor import match_skills_dynamically
-    
-    print(f"🔍 Dynamic skill matching - Job skills: {job_skills}")
-    print(f"🔍 Dynamic skill matching - Resume skills: {resume_skills}")
+    logger.debug("🔍 Dynamic skill matching - Job skills: %s", job_skills)
+    logger.debug("🔍 Dynamic skill matching - Resume skills: %s", resume_skills)
     
     # Get dynamic matches with similarity scores
     skill_matches = match_skills_dynamically(job_skills, resume_skills, threshold=0.7)
@@ -201,7 +274,7 @@ def match_job_to_resume(job, resume_skills, resume_text=""):
     
     # Bonus for specific job titles (more specific = better signal)
     title_lower = job_title.lower()
-    if any(word in title_lower for word in ['frontend', 'backend', 'full stack', 'mobile', 'data', 'ml', 'ai', 'devops', 'cloud', 'security']):
+    if any(word in title_lower for word in SPECIFIC_ROLE_KEYWORDS):
         differentiation_bonus += 3  # Specific role mentioned
     
     # Bonus for remote/hybrid positions (highly sought after)
@@ -218,8 +291,7 @@ def match_job_to_resume(job, resume_skills, resume_text=""):
         differentiation_bonus += 1
     
     # Bonus for number of specific tech keywords in job title
-    tech_keywords = ['react', 'python', 'java', 'aws', 'kubernetes', 'typescript', 'node', 'angular', 'vue']
-    tech_in_title = sum(1 for tech in tech_keywords if tech in title_lower)
+    tech_in_title = sum(1 for tech in TITLE_TECH_KEYWORDS if tech in title_lower)
     differentiation_bonus += min(tech_in_title * 2, 4)  # Up to 4 points
     
     # Apply differentiation bonus to final score
@@ -274,8 +346,6 @@ def match_job_to_resume(job, resume_skills, resume_text=""):
 
 def extract_skills_from_text(text):
     """Extract skills from text using LLM-based analysis instead of hardcoded keywords."""
-    from matching.llm_skill_extractor import extract_job_skills_with_llm
-    
     # Use LLM to extract skills from the text
     # Treat the text as a job description for skill extraction
     skills = extract_job_skills_with_llm("", text, "")
@@ -347,11 +417,11 @@ def intelligent_resume_based_scoring(job, resume_skills, resume_text=""):
     Returns: score (0-100)
     """
     if not resume_text or not resume_text.strip():
-        print("⚠️ No resume text provided for intelligent scoring, using fallback")
+        logger.warning("⚠️ No resume text provided for intelligent scoring, using fallback")
         return fast_job_score_fallback(job, resume_skills)
     
     try:
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        client = get_openai_client()
         
         # Prepare job information
         job_title = job.get("title", "Unknown Position")
@@ -561,9 +631,9 @@ Return exactly this structure:
         complexity = result.get("resume_complexity", "UNKNOWN")
         reasoning = result.get("reasoning", "No reasoning provided")
         
-        print(f"🤖 Intelligent Scoring: {job_company} - {job_title}")
-        print(f"   Score: {score}/100 | Complexity: {complexity}")
-        print(f"   Reasoning: {reasoning}")
+        logger.debug("🤖 Intelligent Scoring: %s - %s", job_company, job_title)
+        logger.debug("   Score: %s/100 | Complexity: %s", score, complexity)
+        logger.debug("   Reasoning: %s", reasoning)
         
         # Return full analysis object instead of just score
         return {
@@ -577,7 +647,7 @@ Return exactly this structure:
         }
         
     except Exception as e:
-        print(f"❌ Error in intelligent scoring for {job.get('title', 'Unknown')}: {e}")
+        logger.error("❌ Error in intelligent scoring for %s: %s", job.get('title', 'Unknown'), e)
         # Fallback to rule-based scoring if LLM fails
         fallback_score = fast_job_score_fallback(job, resume_skills)
         return {
@@ -595,31 +665,18 @@ def fast_job_score_fallback(job, resume_skills):
     Fallback rule-based scoring when LLM is unavailable.
     This is the original fast_job_score logic.
     """
-    from matching.llm_skill_extractor import match_skills_dynamically, extract_job_skills_with_llm
-    
     # CRITICAL: Filter out senior/experienced roles
     job_title = job.get("title", "").lower()
     job_description = job.get("description", "").lower()
     
     # Check for senior/experienced indicators
-    senior_indicators = [
-        "senior", "lead", "principal", "staff", "architect", "manager", "director",
-        "10+ years", "12+ years", "15+ years", "20+ years", "extensive experience",
-        "expert", "advanced", "seasoned", "veteran", "senior level", "leadership"
-    ]
-    
-    for indicator in senior_indicators:
+    for indicator in FALLBACK_SENIOR_INDICATORS:
         if indicator in job_title or indicator in job_description:
             return 0
     
     # Check for high experience requirements
-    experience_patterns = [
-        r'(\d+)\+?\s*years?\s*(?:of\s+)?experience',
-        r'(\d+)\+?\s*years?\s*(?:of\s+)?(?:software|development|programming)'
-    ]
-    
-    for pattern in experience_patterns:
-        matches = re.findall(pattern, f"{job_title} {job_description}")
+    for pattern in HIGH_EXPERIENCE_PATTERNS:
+        matches = pattern.findall(f"{job_title} {job_description}")
         for match in matches:
             try:
                 years = int(match)
@@ -628,7 +685,8 @@ def fast_job_score_fallback(job, resume_skills):
             except ValueError:
                 continue
     
-    # Get job skills
+    # Get job skills. Jobs come from the shared snapshot, so extracted skills stay
+    # local rather than being written back (extract_job_skills_with_llm caches them)
     job_skills = job.get("required_skills", [])
     if not job_skills:
         job_skills = extract_job_skills_with_llm(
@@ -636,7 +694,6 @@ def fast_job_score_fallback(job, resume_skills):
             job.get("description", ""), 
             job.get("company", "")
         )
-        job["required_skills"] = job_skills
     
     if not job_skills or not resume_skills:
         return 0
@@ -664,124 +721,114 @@ def intelligent_prefilter_jobs(jobs, resume_skills, resume_metadata, target_coun
     from the full cache for LLM analysis. Preserves accuracy while being efficient.
     """
     if len(jobs) <= target_count:
-        print(f"⚡ Only {len(jobs)} jobs available, returning all for analysis")
+        logger.info("⚡ Only %d jobs available, returning all for analysis", len(jobs))
         return jobs
     
-    print(f"🔍 Pre-filtering {len(jobs)} jobs to top {target_count} candidates...")
+    logger.info("🔍 Pre-filtering %d jobs to top %d candidates...", len(jobs), target_count)
     
     # Stage 1A: Hard requirement filtering
     experience_level = resume_metadata.get('experience_level', 'student')
     years_experience = resume_metadata.get('years_of_experience', 0)
     is_student = resume_metadata.get('is_student', True)
     
-    filtered_jobs = []
-    for job in jobs:
-        job_title = job.get('title', '').lower()
-        job_description = job.get('description', '').lower()
-        
-        # Filter out senior/inappropriate roles
-        senior_indicators = ['senior', 'lead', 'principal', 'staff', 'architect', 'manager', 'director']
-        if any(indicator in job_title for indicator in senior_indicators):
-            if experience_level in ['student', 'recent_graduate'] or years_experience < 3:
-                continue  # Skip senior roles for junior candidates
-        
-        # Filter out high experience requirements
-        import re
-        exp_patterns = [r'(\d+)\+?\s*years?\s*(?:of\s+)?experience', r'(\d+)\+?\s*years?\s*(?:of\s+)?(?:software|development|programming)']
-        skip_job = False
-        for pattern in exp_patterns:
-            matches = re.findall(pattern, f"{job_title} {job_description}")
-            for match in matches:
-                try:
-                    required_years = int(match)
-                    if required_years >= 5 and years_experience < 3:
-                        skip_job = True
-                        break
-                except ValueError:
-                    continue
-            if skip_job:
-                break
-        
-        if skip_job:
-            continue
-            
-        filtered_jobs.append(job)
-    
-    print(f"   After requirement filtering: {len(filtered_jobs)} jobs remain")
-    
-    # Stage 1B: Smart skill-based scoring
-    scored_jobs = []
-    for job in filtered_jobs:
-        score = calculate_prefilter_score(job, resume_skills, resume_metadata)
-        scored_jobs.append((job, score))
-    
-    # Sort by score and take top candidates
-    scored_jobs.sort(key=lambda x: x[1], reverse=True)
-    top_jobs = [job for job, score in scored_jobs[:target_count]]
-    
-    print(f"   After intelligent filtering: {len(top_jobs)} jobs selected for LLM analysis")
+    # Job-side flags and scores were computed once for this snapshot
+    features = get_prefilter_features(jobs)
+    keep = np.ones(len(jobs), dtype=bool)
+    # Filter out senior/inappropriate roles
+    if experience_level in ['student', 'recent_graduate'] or years_experience < 3:
+        keep &= ~features.senior_title
+    # Filter out high experience requirements
+    if years_experience < 3:
+        keep &= ~features.requires_senior_years
+    filtered_positions = np.flatnonzero(keep)
+    filtered_jobs = [jobs[position] for position in filtered_positions]
+    
+    logger.info("   After requirement filtering: %d jobs remain", len(filtered_jobs))
+    
+    # Stage 1B: Smart skill-based scoring (resume side normalized once, not per job)
+    resume_profile = build_prefilter_resume_profile(resume_skills)
+    skill_variants = resume_profile['skill_variants']
+    titles, descriptions = features.titles, features.descriptions
+    scores = np.array(
+        [prefilter_skill_text_score(skill_variants, titles[position], descriptions[position]) for position in filtered_positions],
+        dtype=np.float64
+    )
+    user_domain_bits = domain_bitmask(resume_profile['user_domains'])
+    scores += 8 * DOMAIN_OVERLAP_COUNTS[features.domain_bits[filtered_positions] & user_domain_bits]  # 8 points per domain match
+    scores += features.static_scores[filtered_positions]
+
+    # Required-skill overlap for every job in one vectorized pass instead of a per-job loop
+    skill_index = get_skill_index(jobs)
+    required_skill_matches = skill_index.overlap_counts(resume_skills)[filtered_positions]
+    scores += np.minimum(required_skill_matches * REQUIRED_SKILL_MATCH_POINTS, REQUIRED_SKILL_MATCH_CAP)
+    # Break ties between equal (integer) scores by IDF-weighted skill similarity; the weight
+    # keeps the bonus under one point, so it never reorders jobs with different scores
+    scores += COSINE_TIEBREAK_WEIGHT * skill_index.cosine_similarity(resume_skills)[filtered_positions]
+    
+    # Take top candidates without sorting every score
+    top_jobs = [filtered_jobs[i] for i in top_k_indices(scores, target_count)]
+    
+    logger.info("   After intelligent filtering: %d jobs selected for LLM analysis", len(top_jobs))
     return top_jobs
 
-def calculate_prefilter_score(job, resume_skills, resume_metadata):
+def build_prefilter_resume_profile(resume_skills):
     """
-    Calculate a preliminary score for job filtering based on multiple factors.
+    Resume-side inputs to the prefilter score that do not depend on the job, built
+    once per resume for intelligent_prefilter_jobs: each skill lowercased with its
+    spelling variants, and the resume's domains.
     """
-    job_title = job.get('title', '').lower()
-    job_description = job.get('description', '').lower()
-    company = job.get('company', '').lower()
-    location = job.get('location', '').lower()
-    
-    score = 0
-    
+    resume_skills_lower = [skill.lower() for skill in resume_skills]
+    resume_skill_set = frozenset(resume_skills_lower)
+    return {
+        'skill_variants': [
+            (skill_lower, (skill_lower.replace('.', ''), skill_lower.replace('js', 'javascript')))
+            for skill_lower in resume_skills_lower
+        ],
+        'user_domains': frozenset(
+            domain for domain, keywords in DOMAIN_KEYWORDS.items()
+            if any(keyword.lower() in resume_skill_set for keyword in keywords)
+        ),
+    }
+
+def prefilter_skill_text_score(skill_variants, job_title, job_description):
+    """Prefilter points for resume skills (or their variants) found in a lowercased job title and description"""
     # Factor 1: Direct skill matches in job title (highest weight)
     title_skills = 0
-    for skill in resume_skills:
-        skill_lower = skill.lower()
+    for skill_lower, variants in skill_variants:
         if skill_lower in job_title:
             title_skills += 15  # High bonus for skill in title
-        elif any(variant in job_title for variant in [skill_lower.replace('.', ''), skill_lower.replace('js', 'javascript')]):
+        elif any(variant in job_title for variant in variants):
             title_skills += 10  # Bonus for skill variants
-    
-    score += min(title_skills, 45)  # Cap at 45 points
+        if title_skills >= 45:
+            break  # Already at the cap; the remaining skills cannot change the score
     
     # Factor 2: Skill matches in description
     description_skills = 0
-    for skill in resume_skills:
-        skill_lower = skill.lower()
+    for skill_lower, variants in skill_variants:
         if skill_lower in job_description:
             description_skills += 5
-        elif any(variant in job_description for variant in [skill_lower.replace('.', ''), skill_lower.replace('js', 'javascript')]):
+        elif any(variant in job_description for variant in variants):
             description_skills += 3
+        if description_skills >= 25:
+            break  # Already at the cap
     
-    score += min(description_skills, 25)  # Cap at 25 points
-    
-    # Factor 3: Domain alignment
-    domain_keywords = {
-        'frontend': ['frontend', 'front-end', 'react', 'angular', 'vue', 'javascript', 'html', 'css'],
-        'backend': ['backend', 'back-end', 'server', 'api', 'node', 'python', 'java', 'database'],
-        'fullstack': ['fullstack', 'full-stack', 'full stack'],
-        'mobile': ['mobile', 'ios', 'android', 'react native', 'flutter', 'swift', 'kotlin'],
-        'data': ['data', 'analytics', 'machine learning', 'ai', 'python', 'sql', 'pandas'],
-        'devops': ['devops', 'cloud', 'aws', 'azure', 'docker', 'kubernetes', 'infrastructure']
+    return min(title_skills, 45) + min(description_skills, 25)  # Capped at 45 and 25 points
+
+def job_prefilter_domains(job_text):
+    """Domains from DOMAIN_KEYWORDS that a lowercased job title + description touches"""
+    return {
+        domain for domain, keywords in DOMAIN_KEYWORDS.items()
+        if any(keyword in job_text for keyword in keywords)
     }
-    
-    user_domains = set()
-    for domain, keywords in domain_keywords.items():
-        if any(keyword.lower() in [skill.lower() for skill in resume_skills] for keyword in keywords):
-            user_domains.add(domain)
-    
-    job_domains = set()
-    job_text = f"{job_title} {job_description}"
-    for domain, keywords in domain_keywords.items():
-        if any(keyword in job_text for keyword in keywords):
-            job_domains.add(domain)
-    
-    domain_overlap = len(user_domains.intersection(job_domains))
-    score += domain_overlap * 8  # 8 points per domain match
+
+def job_prefilter_static_score(job, job_title):
+    """Prefilter points that depend only on the job: company tier, location, internship title"""
+    company = job.get('company', '').lower()
+    location = job.get('location', '').lower()
+    score = 0
     
     # Factor 4: Company quality indicators
-    quality_indicators = ['google', 'microsoft', 'amazon', 'apple', 'meta', 'netflix', 'uber', 'airbnb', 'stripe', 'spotify']
-    if any(indicator in company for indicator in quality_indicators):
+    if any(indicator in company for indicator in TOP_TIER_COMPANIES):
         score += 10  # Bonus for top-tier companies
     
     # Factor 5: Remote/location preferences
@@ -791,40 +838,108 @@ def calculate_prefilter_score(job, resume_skills, resume_metadata):
         score += 3
     
     # Factor 6: Internship indicators
-    internship_indicators = ['intern', 'internship', 'summer', 'co-op', 'new grad', 'entry level']
-    if any(indicator in job_title for indicator in internship_indicators):
+    if any(indicator in job_title for indicator in INTERNSHIP_TITLE_INDICATORS):
         score += 8  # Bonus for clearly marked internships
     
     return score
 
+def job_requires_senior_experience(job_text):
+    """Whether a lowercased job title + description asks for 5+ years of experience"""
+    for pattern in HIGH_EXPERIENCE_PATTERNS:
+        for match in pattern.findall(job_text):
+            try:
+                if int(match) >= 5:
+                    return True
+            except ValueError:
+                continue
+    return False
+
+class PrefilterJobFeatures:
+    """
+    The resume-independent half of intelligent_prefilter_jobs, computed once per job
+    snapshot: lowercased titles and descriptions, the hard-filter flags, each job's
+    domains as a bitmask and its company/location/internship points. Per request
+    only the resume-dependent skill scan still loops over jobs in Python.
+    """
+
+    def __init__(self, jobs):
+        num_jobs = len(jobs)
+        self.titles = []
+        self.descriptions = []
+        self.senior_title = np.zeros(num_jobs, dtype=bool)
+        self.requires_senior_years = np.zeros(num_jobs, dtype=bool)
+        self.domain_bits = np.zeros(num_jobs, dtype=np.int64)
+        self.static_scores = np.zeros(num_jobs, dtype=np.int64)
+
+        for position, job in enumerate(jobs):
+            job_title = job.get('title', '').lower()
+            job_description = job.get('description', '').lower()
+            job_text = f"{job_title} {job_description}"
+            self.titles.append(job_title)
+            self.descriptions.append(job_description)
+            self.senior_title[position] = any(indicator in job_title for indicator in PREFILTER_SENIOR_TITLE_INDICATORS)
+            self.requires_senior_years[position] = job_requires_senior_experience(job_text)
+            self.domain_bits[position] = domain_bitmask(job_prefilter_domains(job_text))
+            self.static_scores[position] = job_prefilter_static_score(job, job_title)
+
+# Bit position of each prefilter domain, for domain sets stored as integers
+DOMAIN_BITS = {domain: 1 << bit for bit, domain in enumerate(DOMAIN_KEYWORDS)}
+# Set bits in every possible domain bitmask, so overlaps are counted with one lookup
+DOMAIN_OVERLAP_COUNTS = np.array([bin(mask).count('1') for mask in range(1 << len(DOMAIN_KEYWORDS))], dtype=np.int64)
+
+def domain_bitmask(domains):
+    """Integer with one bit set per domain name"""
+    mask = 0
+    for domain in domains:
+        mask |= DOMAIN_BITS[domain]
+    return mask
+
+# Features for the most recent job list as one (jobs, features) tuple; rebuilt when the list changes
+_cached_prefilter_features = {"entry": None}
+
+def get_prefilter_features(jobs):
+    """
+    Return the PrefilterJobFeatures for this job list, building them on first use.
+    The app serves one shared job snapshot between refreshes, so they are built
+    once per refresh instead of once per request.
+    """
+    entry = _cached_prefilter_features["entry"]
+    if entry is not None and entry[0] is jobs:
+        return entry[1]
+    features = PrefilterJobFeatures(jobs)
+    _cached_prefilter_features["entry"] = (jobs, features)
+    return features
+
 def batch_analyze_jobs_with_llm(filtered_jobs, resume_skills, resume_text, resume_metadata):
     """
     Comprehensive batch LLM analysis of pre-filtered jobs.
     Single LLM call to analyze all jobs with detailed scoring and reasoning.
+    Returns (job_scores, used_fallback); used_fallback is True when the LLM call
+    failed and the scores come from rule-based fallback scoring instead.
     """
     if not filtered_jobs:
-        return []
+        return [], False
     
-    print(f"🤖 Starting batch LLM analysis of {len(filtered_jobs)} jobs...")
+    logger.info("🤖 Starting batch LLM analysis of %d jobs...", len(filtered_jobs))
     
     try:
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        client = get_openai_client()
         
         # Create candidate profile summary
         experience_level = resume_metadata.get('experience_level', 'student')
         years_experience = resume_metadata.get('years_of_experience', 0)
         
         # Format jobs for batch analysis
-        jobs_summary = []
-        for i, job in enumerate(filtered_jobs):
-            job_summary = {
+        jobs_summary = [
+            {
                 "job_id": i + 1,
                 "company": job.get('company', 'Unknown'),
                 "title": job.get('title', 'Unknown'),
                 "location": job.get('location', 'Unknown'),
                 "description": job.get('description', '')[:500]  # Limit description length
             }
-            jobs_summary.append(job_summary)
+            for i, job in enumerate(filtered_jobs)
+        ]
         
         # Create comprehensive batch analysis prompt
         prompt = f"""You are an expert technical recruiter and career advisor who values REAL-WORLD IMPACT and PROJECT DEPTH over keyword matching.
@@ -949,31 +1064,31 @@ Return ONLY valid JSON:
         result = json.loads(response.choices[0].message.content)
         job_scores = result.get("job_scores", [])
         
-        print(f"✅ Batch LLM analysis complete: {len(job_scores)} jobs analyzed")
-        print(f"📊 Score range: {min([j['match_score'] for j in job_scores])}-{max([j['match_score'] for j in job_scores])}")
+        logger.info("✅ Batch LLM analysis complete: %d jobs analyzed", len(job_scores))
+        logger.info("📊 Score range: %s-%s", min([j['match_score'] for j in job_scores]), max([j['match_score'] for j in job_scores]))
         
-        return job_scores
+        return job_scores, False
         
     except Exception as e:
-        print(f"❌ Error in batch LLM analysis: {e}")
+        logger.error("❌ Error in batch LLM analysis: %s", e)
         
         # Fallback: use enhanced rule-based scoring
-        print("🔄 Using enhanced fallback scoring...")
+        logger.info("🔄 Using enhanced fallback scoring...")
         fallback_scores = []
         for i, job in enumerate(filtered_jobs):
-            fallback_score = fast_job_score_fallback(job, resume_skills)
+            score = fast_job_score_fallback(job, resume_skills)
             fallback_scores.append({
                 "job_id": i + 1,
                 "company": job.get('company', 'Unknown'),
                 "title": job.get('title', 'Unknown'),
-                "match_score": fallback_score,
-                "reasoning": f"Fallback analysis - {fallback_score}% skill match",
+                "match_score": score,
+                "reasoning": f"Fallback analysis - {score}% skill match",
                 "red_flags": [],
                 "skill_matches": [],
                 "skill_gaps": []
             })
         
-        return fallback_scores
+        return fallback_scores, True
 
 def enhance_batch_results(llm_scores, original_jobs, resume_skills=None):
     """
@@ -1003,13 +1118,13 @@ def enhance_batch_results(llm_scores, original_jobs, resume_skills=None):
                 if job_skills and resume_skills:
                     # Use dynamic skill matching to get actual matches
                     try:
-                        from matching.llm_skill_extractor import match_skills_dynamically
                         # Get real skill matches using the dynamic matching system
                         matches = match_skills_dynamically(job_skills, resume_skills, threshold=0.7)
                         skill_matches = [match["job_skill"] for match in matches]
                         
                         # Skills that weren't matched are gaps
-                        skill_gaps = [skill for skill in job_skills if skill not in skill_matches]
+                        matched_skill_set = set(skill_matches)
+                        skill_gaps = [skill for skill in job_skills if skill not in matched_skill_set]
                     except:
                         # Final fallback based on score
                         if match_score > 0:
@@ -1027,13 +1142,7 @@ def enhance_batch_results(llm_scores, original_jobs, resume_skills=None):
             
             # Determine resume complexity based on score, skills, AND real-world impact indicators
             # Look for production/impact keywords in the reasoning
-            production_indicators = [
-                'production', 'deployed', 'users', 'live', 'published', 'shipped',
-                'performance', 'scale', 'optimization', 'real-world', 'impact',
-                'metrics', 'revenue', 'intern', 'company', 'team', 'enterprise'
-            ]
-            
-            impact_count = sum(1 for indicator in production_indicators if indicator in reasoning)
+            impact_count = sum(1 for indicator in PRODUCTION_IMPACT_INDICATORS if indicator in reasoning)
             
             # Advanced: High score + many skills + production impact
             if match_score >= 75 and len(skill_matches) >= 4 and impact_count >= 2:
@@ -1148,56 +1257,70 @@ def create_rich_match_description(job, score_data, ai_reasoning):
     
     return opening + ai_section + skill_section + red_flag_section + location_section + score_section
 
-def match_resume_to_jobs(resume_skills, jobs, resume_text=""):
+def match_resume_to_jobs(resume_skills, jobs, resume_text="", resume_text_lower=None):
     """
     Ultra-efficient 3-stage job matching with single LLM call.
     Stage 1: Pre-filter jobs (free, fast)
     Stage 2: Batch LLM analysis (single call)
     Stage 3: Enhanced results
     """
+    return match_resume_to_jobs_with_status(resume_skills, jobs, resume_text, resume_text_lower)[0]
+
+def match_resume_to_jobs_with_status(resume_skills, jobs, resume_text="", resume_text_lower=None):
+    """
+    match_resume_to_jobs that also reports how the results were scored.
+    Returns (matched_jobs, used_fallback); used_fallback is True when the batch LLM
+    analysis failed and rule-based or legacy scoring stood in for it, so callers
+    can avoid caching degraded results.
+    """
     if not jobs:
-        return []
+        return [], False
+
+    if resume_text_lower is None:
+        resume_text_lower = resume_text.lower()
     
-    print(f"🎯 Starting efficient 3-stage matching with {len(jobs)} jobs and {len(resume_skills)} resume skills")
+    logger.info("🎯 Starting efficient 3-stage matching with %d jobs and %d resume skills", len(jobs), len(resume_skills))
     
     # Extract resume metadata for filtering (should already be available from parse_resume)
     resume_metadata = {
-        'experience_level': extract_user_experience_level(resume_skills, resume_text),
+        'experience_level': extract_user_experience_level(resume_skills, resume_text, resume_text_lower),
         'years_of_experience': 0,  # Default for now, could be extracted
         'is_student': True  # Default assumption for internships
     }
     
     # STAGE 1: Intelligent Pre-filtering (FREE, <1 second)
-    print("🔍 Stage 1: Pre-filtering jobs with intelligent criteria...")
+    logger.info("🔍 Stage 1: Pre-filtering jobs with intelligent criteria...")
     filtered_jobs = intelligent_prefilter_jobs(jobs, resume_skills, resume_metadata, target_count=50)
     
     if not filtered_jobs:
-        print("❌ No jobs passed pre-filtering criteria")
-        return []
+        logger.warning("❌ No jobs passed pre-filtering criteria")
+        return [], False
     
     # STAGE 2: Batch LLM Analysis (Single LLM call, ~$0.08-0.15)
-    print("🤖 Stage 2: Comprehensive batch LLM analysis...")
-    llm_scores = batch_analyze_jobs_with_llm(filtered_jobs, resume_skills, resume_text, resume_metadata)
+    logger.info("🤖 Stage 2: Comprehensive batch LLM analysis...")
+    llm_scores, used_fallback = batch_analyze_jobs_with_llm(filtered_jobs, resume_skills, resume_text, resume_metadata)
     
     if not llm_scores:
-        print("❌ LLM analysis failed, using fallback")
-        # Fallback to legacy approach
-        return match_resume_to_jobs_legacy(resume_skills, filtered_jobs[:20], resume_text)
+        logger.warning("❌ LLM analysis failed, using fallback")
+        # Fallback to legacy approach. Its scoring is local and cheap, so every
+        # prefiltered job is scored rather than a truncated slice
+        return match_resume_to_jobs_legacy(resume_skills, filtered_jobs, resume_text, resume_text_lower), True
     
     # STAGE 3: Enhanced Results Processing
-    print("✨ Stage 3: Enhancing results with rich descriptions...")
+    logger.info("✨ Stage 3: Enhancing results with rich descriptions...")
     enhanced_jobs = enhance_batch_results(llm_scores, filtered_jobs, resume_skills)
     
-    # Quality assurance
-    unique_scores = len(set([job['match_score'] for job in enhanced_jobs]))
-    total_jobs = len(enhanced_jobs)
-    diversity_ratio = unique_scores / total_jobs if total_jobs > 0 else 0
-    
-    print(f"✅ Efficient matching complete: {len(enhanced_jobs)} jobs analyzed")
-    print(f"📊 Score diversity: {unique_scores} unique scores out of {total_jobs} jobs ({diversity_ratio:.1%})")
-    print(f"💰 Cost: Single LLM call (~$0.08-0.15) vs {len(jobs)} individual calls (~${len(jobs) * 0.02:.2f})")
+    logger.info("✅ Efficient matching complete: %d jobs analyzed", len(enhanced_jobs))
+
+    # Quality assurance stats are only worth computing when someone will see them
+    if logger.isEnabledFor(logging.DEBUG):
+        unique_scores = len({job['match_score'] for job in enhanced_jobs})
+        total_jobs = len(enhanced_jobs)
+        diversity_ratio = unique_scores / total_jobs if total_jobs > 0 else 0
+        logger.debug("📊 Score diversity: %d unique scores out of %d jobs (%.1f%%)", unique_scores, total_jobs, diversity_ratio * 100)
+        logger.debug("💰 Cost: Single LLM call (~$0.08-0.15) vs %d individual calls (~$%.2f)", len(jobs), len(jobs) * 0.02)
     
-    return enhanced_jobs
+    return enhanced_jobs, used_fallback
 
 def match_resume_to_jobs_legacy_fallback(resume_skills, jobs, resume_text=""):
     """
@@ -1208,7 +1331,7 @@ def match_resume_to_jobs_legacy_fallback(resume_skills, jobs, resume_text=""):
     if not jobs:
         return []
     
-    print(f"⚠️ Using legacy expensive matching with {len(jobs)} jobs and {len(resume_skills)} resume skills")
+    logger.warning("⚠️ Using legacy expensive matching with %d jobs and %d resume skills", len(jobs), len(resume_skills))
     
     # Extract resume metadata for filtering
     resume_metadata = {
@@ -1218,35 +1341,38 @@ def match_resume_to_jobs_legacy_fallback(resume_skills, jobs, resume_text=""):
     }
     
     # STAGE 0: Intelligent Pre-filtering (to reduce LLM costs)
-    print("🔍 Stage 0: Pre-filtering jobs with intelligent criteria...")
+    logger.info("🔍 Stage 0: Pre-filtering jobs with intelligent criteria...")
     filtered_jobs = intelligent_prefilter_jobs(jobs, resume_skills, resume_metadata, target_count=50)
     
     if not filtered_jobs:
-        print("❌ No jobs passed pre-filtering criteria")
+        logger.warning("❌ No jobs passed pre-filtering criteria")
         return []
     
-    print(f"✅ Pre-filtered to {len(filtered_jobs)} jobs from {len(jobs)} total")
+    logger.info("✅ Pre-filtered to %d jobs from %d total", len(filtered_jobs), len(jobs))
     
     # Stage 1: Analyze candidate profile once (cached)
-    from matching.llm_skill_extractor import analyze_candidate_profile_with_llm
-    
-    print("🧠 Stage 1: Analyzing candidate profile...")
+    logger.info("🧠 Stage 1: Analyzing candidate profile...")
     try:
         candidate_profile = analyze_candidate_profile_with_llm(resume_skills, resume_text)
     except:
-        print("❌ Candidate profile analysis failed, continuing without it")
+        logger.error("❌ Candidate profile analysis failed, continuing without it")
         candidate_profile = None
     
     # Stage 2: Intelligent LLM-based scoring with resume complexity analysis
-    print("🤖 Stage 2: Intelligent resume-based scoring (analyzing complexity)...")
+    logger.info("🤖 Stage 2: Intelligent resume-based scoring (analyzing complexity)...")
     matched_jobs = []
     
-    for i, job in enumerate(filtered_jobs):
-        if i % 10 == 0:  # Progress indicator (every 10 jobs since we're using LLM)
-            print(f"   Processing job {i+1}/{len(filtered_jobs)}")
-        
-        # Use intelligent LLM-based scoring that heavily weights resume complexity
-        llm_analysis = intelligent_resume_based_scoring(job, resume_skills, resume_text)
+    # Use intelligent LLM-based scoring that heavily weights resume complexity. Each
+    # job is its own LLM call, so run several at once instead of waiting on each in turn.
+    # The threads share the snapshot's job dicts, so scoring must only read them
+    # (skills extracted along the way stay local to fast_job_score_fallback)
+    with ThreadPoolExecutor(max_workers=LEGACY_SCORING_WORKERS) as executor:
+        llm_analyses = list(executor.map(
+            lambda job: intelligent_resume_based_scoring(job, resume_skills, resume_text),
+            filtered_jobs
+        ))
+    
+    for job, llm_analysis in zip(filtered_jobs, llm_analyses):
         score = llm_analysis["score"]
         
         # Generate rich description from LLM analysis data instead of calling legacy matcher
@@ -1262,12 +1388,12 @@ def match_resume_to_jobs_legacy_fallback(resume_skills, jobs, resume_text=""):
     # Sort by match score (highest first)
     matched_jobs.sort(key=lambda x: x['match_score'], reverse=True)
     
-    print(f"✅ Legacy matching complete: Returning all {len(matched_jobs)} jobs with scores")
-    print(f"📊 Score distribution: {len([j for j in matched_jobs if j['match_score'] > 0])} jobs with score > 0")
+    logger.info("✅ Legacy matching complete: Returning all %d jobs with scores", len(matched_jobs))
+    logger.info("📊 Score distribution: %d jobs with score > 0", len([j for j in matched_jobs if j['match_score'] > 0]))
     
     return matched_jobs
 
-def match_resume_to_jobs_legacy(resume_skills, jobs, resume_text=""):
+def match_resume_to_jobs_legacy(resume_skills, jobs, resume_text="", resume_text_lower=None):
     """
     LEGACY: Original one-stage matching for comparison/fallback.
     Uses intelligent prefiltering before matching.
@@ -1275,46 +1401,52 @@ def match_resume_to_jobs_legacy(resume_skills, jobs, resume_text=""):
     """
     if not jobs:
         return []
+
+    # Lowercase the resume once rather than once per matched job
+    if resume_text_lower is None:
+        resume_text_lower = resume_text.lower()
     
-    print(f"🎯 Starting legacy matching process with {len(jobs)} jobs and {len(resume_skills)} resume skills")
+    logger.info("🎯 Starting legacy matching process with %d jobs and %d resume skills", len(jobs), len(resume_skills))
     
     # Extract resume metadata for filtering
     resume_metadata = {
-        'experience_level': extract_user_experience_level(resume_skills, resume_text),
+        'experience_level': extract_user_experience_level(resume_skills, resume_text, resume_text_lower),
         'years_of_experience': 0,
         'is_student': True
     }
     
     # STAGE 1: Intelligent Pre-filtering (even for legacy mode)
-    print("🔍 Stage 1: Pre-filtering jobs with intelligent criteria...")
+    logger.info("🔍 Stage 1: Pre-filtering jobs with intelligent criteria...")
     filtered_jobs = intelligent_prefilter_jobs(jobs, resume_skills, resume_metadata, target_count=50)
     
     if not filtered_jobs:
-        print("❌ No jobs passed pre-filtering criteria")
+        logger.warning("❌ No jobs passed pre-filtering criteria")
         return []
     
-    print(f"✅ Pre-filtered to {len(filtered_jobs)} jobs from {len(jobs)} total")
+    logger.info("✅ Pre-filtered to %d jobs from %d total", len(filtered_jobs), len(jobs))
     
-    # STAGE 2: Match each prefiltered job
-    matched_jobs = []
+    # STAGE 2: Match each prefiltered job. The resume side of the comparison is the
+    # same for every job, so analyze it once up front
+    resume_analysis = extract_resume_metadata(resume_skills, resume_text, resume_text_lower)
+    scored = [
+        match_job_to_resume(
+            job, resume_skills, resume_text, resume_text_lower,
+            resume_metadata=resume_analysis, user_experience=resume_metadata['experience_level']
+        )
+        for job in filtered_jobs
+    ]
     
-    for i, job in enumerate(filtered_jobs):
-        print(f"🔍 Matching job {i+1}/{len(filtered_jobs)}: {job.get('company', 'Unknown')} - {job.get('title', 'Unknown')}")
-        
-        score, description = match_job_to_resume(job, resume_skills, resume_text)
-        
-        print(f"   Score: {score}, Skills: {job.get('required_skills', [])}")
-        
-        # Include ALL jobs with scores (even 0) for debugging
-        job_with_score = job.copy()
-        job_with_score['match_score'] = score
-        job_with_score['match_description'] = description
-        matched_jobs.append(job_with_score)
+    # Include ALL jobs with scores (even 0) for debugging
+    matched_jobs = [
+        {**job, 'match_score': score, 'match_description': description}
+        for job, (score, description) in zip(filtered_jobs, scored)
+    ]
     
     # Sort by match score in descending order
     matched_jobs.sort(key=lambda x: x['match_score'], reverse=True)
     
-    print(f"🎯 Legacy matching complete: {len(matched_jobs)} total jobs, {len([j for j in matched_jobs if j['match_score'] > 0])} with score > 0")
+    logger.info("🎯 Legacy matching complete: %d total jobs, %d with score > 0",
+                len(matched_jobs), sum(1 for j in matched_jobs if j['match_score'] > 0))
     
     # Return all jobs with scores for pagination and filtering
     return matched_jobs
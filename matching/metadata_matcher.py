@@ -1,9 +1,10 @@
 import re
 from typing import Dict, List, Tuple, Any
 
-def extract_resume_metadata(resume_skills: List[str], resume_text: str = "") -> Dict[str, Any]:
+def extract_resume_metadata(resume_skills: List[str], resume_text: str = "", text_lower: str = None) -> Dict[str, Any]:
     """
     Extract metadata from resume including experience level, education, location preferences, etc.
+    text_lower can be passed in when the caller has already lowercased resume_text.
     """
     metadata = {
         "experience_level": "student",  # Default for internship matching
@@ -25,7 +26,8 @@ def extract_resume_metadata(resume_skills: List[str], resume_text: str = "") ->
         "student": ["student", "intern", "internship", "co-op", "undergraduate", "graduate"]
     }
     
-    text_lower = resume_text.lower()
+    if text_lower is None:
+        text_lower = resume_text.lower()
     for level, indicators in experience_indicators.items():
         for indicator in indicators:
             if indicator in text_lower:
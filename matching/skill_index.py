@@ -0,0 +1,182 @@
+"""
+Vectorized skill overlap between a resume and the cached job list.
+
+Each job's required_skills are encoded once as a row of bits over the job skill
+vocabulary (packed into uint64 words), so scoring a resume against every job is
+one bitwise AND plus a popcount instead of a Python loop over jobs and skills.
+IDF weights and per-skill job postings are computed at the same time, once per
+job snapshot, for the weighted similarity.
+"""
+import hashlib
+
+import numpy as np
+
+from .llm_skill_extractor import normalize_skill
+
+
+if hasattr(np, "bitwise_count"):
+    def _popcount_rows(words):
+        """Number of set bits in each row of a 2-D uint64 array (hardware popcount)"""
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int32)
+else:
+    # NumPy < 2.0 has no popcount ufunc; expand the bits and count them instead
+    def _popcount_rows(words):
+        """Number of set bits in each row of a 2-D uint64 array"""
+        return np.unpackbits(words.view(np.uint8), axis=1).sum(axis=1, dtype=np.int32)
+
+
+class SkillIndex:
+    """
+    Bit-packed job x skill matrix built from job['required_skills'].
+    Row i corresponds to jobs[i] in the list the index was built from.
+    """
+
+    def __init__(self, jobs):
+        vocabulary = {}
+        rows = []
+        skill_ids = []
+
+        for row, job in enumerate(jobs):
+            job_skill_ids = {
+                vocabulary.setdefault(normalize_skill(skill), len(vocabulary))
+                for skill in job.get('required_skills') or []
+                if isinstance(skill, str) and skill.strip()
+            }
+            rows.extend([row] * len(job_skill_ids))
+            skill_ids.extend(job_skill_ids)
+
+        self.vocabulary = vocabulary
+        self.num_jobs = len(jobs)
+        self.num_words = max(1, (len(vocabulary) + 63) // 64)
+
+        rows = np.asarray(rows, dtype=np.int64)
+        skill_ids = np.asarray(skill_ids, dtype=np.uint64)
+        # One bit per (job, skill); a job's skills are distinct, so OR-ing each bit in once is exact
+        self.skill_bits = np.zeros((self.num_jobs, self.num_words), dtype=np.uint64)
+        np.bitwise_or.at(
+            self.skill_bits,
+            (rows, (skill_ids >> np.uint64(6)).astype(np.int64)),
+            np.left_shift(np.uint64(1), skill_ids & np.uint64(63))
+        )
+        self.job_skill_counts = np.bincount(rows, minlength=self.num_jobs).astype(np.int32)
+
+        # IDF weights over the job corpus: a skill most jobs ask for says little about
+        # fit, a rare one says a lot. Smoothed so no skill gets a zero weight.
+        skill_ids = skill_ids.astype(np.int64)
+        document_frequency = np.bincount(skill_ids, minlength=len(vocabulary))
+        self.idf = np.log((self.num_jobs + 1) / (document_frequency + 1)) + 1.0
+        squared_weights = self.idf ** 2
+        self.job_weighted_norms = np.sqrt(
+            np.bincount(rows, weights=squared_weights[skill_ids], minlength=self.num_jobs)
+        )
+        # Jobs grouped by skill (column-major postings), so scoring a resume only
+        # touches the jobs that share at least one of its skills
+        order = np.argsort(skill_ids, kind="stable")
+        self.skill_job_rows = rows[order]
+        self.skill_job_offsets = np.concatenate(([0], np.cumsum(document_frequency)))
+
+    def resume_vector(self, resume_skills):
+        """Bitmask over the job skill vocabulary for the resume's skills, in the row layout"""
+        vector = np.zeros(self.num_words, dtype=np.uint64)
+        for skill in resume_skills:
+            skill_id = self.vocabulary.get(normalize_skill(skill))
+            if skill_id is not None:
+                vector[skill_id >> 6] |= np.uint64(1) << np.uint64(skill_id & 63)
+        return vector
+
+    def resume_skill_ids(self, resume_skills):
+        """Distinct vocabulary ids of the resume skills that some job asks for"""
+        skill_ids = {self.vocabulary.get(normalize_skill(skill)) for skill in resume_skills}
+        skill_ids.discard(None)
+        return np.fromiter(skill_ids, dtype=np.int64, count=len(skill_ids))
+
+    def overlap_counts(self, resume_skills):
+        """
+        Number of each job's required skills that appear in the resume.
+        Returns an integer array with one entry per indexed job.
+        """
+        resume_vector = self.resume_vector(resume_skills)
+        return _popcount_rows(np.bitwise_and(self.skill_bits, resume_vector))
+
+    def cosine_similarity(self, resume_skills):
+        """
+        IDF-weighted cosine similarity between the resume's skill set and each job's,
+        as floats in [0, 1]. Shared skills count by their squared IDF weight, so
+        matching on a rare skill outweighs matching on one nearly every job lists.
+        """
+        skill_ids = self.resume_skill_ids(resume_skills)
+        if not len(skill_ids):
+            return np.zeros(self.num_jobs)
+        starts = self.skill_job_offsets[skill_ids]
+        lengths = self.skill_job_offsets[skill_ids + 1] - starts
+        # Positions of every posting of the resume's skills, gathered without a Python loop
+        group_offsets = np.cumsum(lengths) - lengths
+        posting_positions = np.repeat(starts - group_offsets, lengths) + np.arange(lengths.sum())
+        squared_weights = self.idf[skill_ids] ** 2
+        dot_products = np.bincount(
+            self.skill_job_rows[posting_positions],
+            weights=np.repeat(squared_weights, lengths),
+            minlength=self.num_jobs
+        )
+        norms = self.job_weighted_norms * np.sqrt(squared_weights.sum())
+        return np.divide(dot_products, norms, out=np.zeros(self.num_jobs), where=norms > 0)
+
+
+# Index for the most recent job list as one (jobs, fingerprint, index) tuple, so
+# threads matching concurrently always see a consistent entry; rebuilt only when
+# the job skills change
+_cached_index = {"entry": None}
+
+
+def jobs_skill_fingerprint(jobs):
+    """Content hash of every job's required_skills, in job order"""
+    hasher = hashlib.blake2b(digest_size=16)
+    for job in jobs:
+        for skill in job.get('required_skills') or []:
+            if isinstance(skill, str):
+                hasher.update(skill.encode('utf-8', 'surrogatepass'))
+                hasher.update(b'\x1f')
+        hasher.update(b'\x1e')
+    return hasher.hexdigest()
+
+
+def get_skill_index(jobs):
+    """
+    Return the SkillIndex for this job list, building it on first use.
+    The app serves one shared job snapshot between refreshes, so the index is
+    built once per refresh instead of once per request. A reloaded snapshot
+    with the same job skills (the usual case when the cache has not changed)
+    reuses the existing index instead of rebuilding it.
+    """
+    entry = _cached_index["entry"]
+    if entry is not None and entry[0] is jobs:
+        return entry[2]
+
+    fingerprint = jobs_skill_fingerprint(jobs)
+    if entry is not None and entry[1] == fingerprint:
+        index = entry[2]
+    else:
+        index = SkillIndex(jobs)
+    # Holding the list with its index keeps the identity check above valid
+    _cached_index["entry"] = (jobs, fingerprint, index)
+    return index
+
+
+def top_k_indices(scores, k):
+    """
+    Indices of the k highest scores, best first, without sorting the whole array.
+    Ties keep their original order, matching a stable descending sort.
+    """
+    scores = np.asarray(scores)
+    if k <= 0:
+        return np.array([], dtype=np.int64)
+    if k >= len(scores):
+        candidates = np.arange(len(scores))
+    else:
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        # argpartition leaves ties at the boundary arbitrary; include all tied
+        # candidates so the stable ordering below picks the earliest ones
+        threshold = scores[candidates].min()
+        candidates = np.union1d(candidates, np.flatnonzero(scores == threshold))
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order][:k]
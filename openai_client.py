@@ -0,0 +1,38 @@
+"""
+Shared OpenAI client.
+
+Creating an OpenAI client per call also creates a new HTTP connection pool, so
+every LLM request paid for a fresh TCP + TLS handshake. One client per process
+keeps connections to the API alive between requests.
+"""
+import os
+import threading
+
+import httpx
+from openai import OpenAI
+
+# Connection pool shared by every LLM call in this process
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+
+# Global OpenAI client instance
+_openai_client = None
+_openai_client_lock = threading.Lock()
+
+
+def get_openai_client() -> OpenAI:
+    """Get or create the process-wide OpenAI client"""
+    global _openai_client
+    if _openai_client is None:
+        with _openai_client_lock:
+            if _openai_client is None:
+                _openai_client = OpenAI(
+                    api_key=os.getenv("OPENAI_API_KEY"),
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(
+                            max_connections=OPENAI_MAX_CONNECTIONS,
+                            max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS
+                        )
+                    )
+                )
+    return _openai_client
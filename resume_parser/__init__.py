@@ -1,3 +1,5 @@
-from .parse_resume import parse_resume, is_valid_resume
+from .parse_resume import parse_resume, preload_parser_dependencies
+from .validators import is_valid_resume
+from .parse_cache import get_cached_parse, cache_parse_result
 
-__all__ = ['parse_resume', 'is_valid_resume']
+__all__ = ['parse_resume', 'preload_parser_dependencies', 'is_valid_resume', 'get_cached_parse', 'cache_parse_result']
@@ -0,0 +1,39 @@
+"""
+In-process cache of parsed resumes, keyed by a hash of the uploaded file.
+
+Users often re-upload the same resume, and parsing (PDF extraction or OCR plus
+the LLM skill extraction) is by far the slowest step of a match. The cache
+keeps the parse result and the validity verdict for recently seen files so a
+re-upload skips straight to matching.
+"""
+import threading
+from collections import OrderedDict
+
+# Number of distinct (file, parsing mode) results kept per worker
+PARSE_CACHE_SIZE = 256
+
+_parse_cache = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def get_cached_parse(digest, use_llm=True):
+    """
+    Look up a previous parse of the file with this content hash.
+    Returns a dict with 'result' (skills, text, metadata) and 'is_valid', or None.
+    """
+    key = (digest, use_llm)
+    with _parse_cache_lock:
+        entry = _parse_cache.get(key)
+        if entry is not None:
+            _parse_cache.move_to_end(key)
+        return entry
+
+
+def cache_parse_result(digest, use_llm, result, is_valid):
+    """Remember the parse result and validity verdict for a file's content hash"""
+    key = (digest, use_llm)
+    with _parse_cache_lock:
+        _parse_cache[key] = {"result": result, "is_valid": is_valid}
+        _parse_cache.move_to_end(key)
+        while len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
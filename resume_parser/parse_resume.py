@@ -1,9 +1,8 @@
-import pdfplumber
 import re
 import os
 import io
 import json
-from openai import OpenAI
+from openai_client import get_openai_client
 from typing import List, Dict, Any
 
 # Static system prompt for resume analysis (cached across calls)
@@ -60,7 +59,7 @@ def extract_skills_with_llm(resume_text: str) -> List[str]:
     Returns a list of skills that the person actually possesses.
     """
     try:
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        client = get_openai_client()
         response = client.chat.completions.create(
             model="gpt-5-mini-2025-08-07",
             messages=[
@@ -88,32 +87,37 @@ def extract_skills_with_llm(resume_text: str) -> List[str]:
         # Re-raise the exception to be handled by the calling function
         raise Exception(f"LLM skill extraction failed: {str(e)}")
 
+# Most common technical skills that are likely to match job requirements
+BASIC_SKILL_KEYWORDS = (
+    "Python", "Java", "JavaScript", "TypeScript", "React", "Angular", "Vue",
+    "HTML", "CSS", "SQL", "Git", "Node.js", "Express", "Django", "Flask",
+    "Spring", "AWS", "Azure", "GCP", "Docker", "Kubernetes", "MongoDB",
+    "PostgreSQL", "MySQL", "TensorFlow", "PyTorch", "Pandas", "NumPy",
+    "Machine Learning", "Data Analysis", "Software Engineering", "Programming",
+    "C++", "C#", "PHP", "Ruby", "Go", "Rust", "Bootstrap", "jQuery",
+    "REST API", "GraphQL", "Linux", "Testing", "Agile", "Scrum"
+)
+BASIC_SKILL_BY_KEYWORD = {skill.lower(): skill for skill in BASIC_SKILL_KEYWORDS}
+# All keywords in one case-insensitive pass, each with the same word boundaries as a
+# per-keyword \bkeyword\b search. The lookahead lets matches overlap; no two keywords
+# can both match at the same position, so the alternation never hides one behind another
+BASIC_SKILL_PATTERN = re.compile(
+    r"\b(?=(" + "|".join(
+        re.escape(keyword) for keyword in sorted(BASIC_SKILL_BY_KEYWORD, key=len, reverse=True)
+    ) + r")\b)",
+    re.IGNORECASE
+)
+
 def extract_basic_skills_from_text(resume_text: str) -> List[str]:
     """
     Extract basic skills from text using simple keyword matching.
     This is a fallback when LLM extraction fails or returns no results.
     """
-    # Most common technical skills that are likely to match job requirements
-    basic_skill_keywords = [
-        "Python", "Java", "JavaScript", "TypeScript", "React", "Angular", "Vue",
-        "HTML", "CSS", "SQL", "Git", "Node.js", "Express", "Django", "Flask",
-        "Spring", "AWS", "Azure", "GCP", "Docker", "Kubernetes", "MongoDB",
-        "PostgreSQL", "MySQL", "TensorFlow", "PyTorch", "Pandas", "NumPy",
-        "Machine Learning", "Data Analysis", "Software Engineering", "Programming",
-        "C++", "C#", "PHP", "Ruby", "Go", "Rust", "Bootstrap", "jQuery",
-        "REST API", "GraphQL", "Linux", "Testing", "Agile", "Scrum"
-    ]
-    
-    found_skills = []
-    text_lower = resume_text.lower()
-    
-    for skill in basic_skill_keywords:
-        skill_lower = skill.lower()
-        # Simple word boundary check
-        if re.search(r'\b' + re.escape(skill_lower) + r'\b', text_lower):
-            found_skills.append(skill)
-    
-    return list(set(found_skills))
+    found_skills = {
+        BASIC_SKILL_BY_KEYWORD[match.group(1).lower()]
+        for match in BASIC_SKILL_PATTERN.finditer(resume_text)
+    }
+    return list(found_skills)
 
 def extract_skills_with_regex(resume_text: str) -> List[str]:
     """
@@ -122,37 +126,139 @@ def extract_skills_with_regex(resume_text: str) -> List[str]:
     skills = re.findall(r"\b(Python|Java|React|Data Analysis|SQL|TensorFlow|C\+\+|JavaScript|Computer Science|Technical|Programming|Software|Engineering|Data|Machine Learning|AI|Cloud|Leadership|Communication|Teamwork|Problem Solving|Git|Rust|Less|Go|R\b|C#|TypeScript|PHP|Ruby|Scala|Matlab|Perl|Bash|Shell|PowerShell|Angular|Vue|Node\.js|Express|Django|Flask|Spring|Laravel|HTML|CSS|Sass|Bootstrap|Tailwind|jQuery|Ajax|REST API|GraphQL|WebSocket|HTTP|HTTPS|JSON|XML|MySQL|PostgreSQL|MongoDB|Redis|Elasticsearch|Cassandra|Data Science|Data Engineering|ETL|Data Pipeline|Deep Learning|Artificial Intelligence|Neural Networks|PyTorch|Scikit-learn|Pandas|Numpy|Matplotlib|Seaborn|Computer Vision|NLP|Natural Language Processing|Recommendation Systems|AWS|Azure|GCP|Google Cloud|Docker|Kubernetes|Jenkins|GitLab|GitHub|CI/CD|Terraform|Ansible|Prometheus|Grafana|Software Development|Coding|Algorithm|Data Structures|Object-oriented|Functional Programming|Design Patterns|Microservices|API Development|Backend|Frontend|Full Stack|Fullstack|Mobile Development|iOS|Android|React Native|Flutter|Xamarin|Testing|Unit Testing|Integration Testing|QA|Quality Assurance|Test Automation|Selenium|JUnit|PyTest|Jest|Cypress|Maven|Gradle|NPM|Yarn|IntelliJ|VSCode|Eclipse|Vim|Emacs|Linux|Unix|macOS|E-commerce|Fintech|Healthcare|Cybersecurity|Blockchain|IoT|Embedded Systems|FPGA|Hardware|Robotics|Autonomous Vehicles|Agile|Scrum|Project Management|Mentoring|Collaboration|Presentation|Student|Intern|Internship|Co-op|Research|Thesis|Academic|University|College|Bachelor|Master|PhD|Graduate|Undergraduate|Mathematics|Statistics|Physics)\b", resume_text, re.IGNORECASE)
     return list(set([s.title() for s in skills]))
 
+# A PDF text layer averaging fewer characters than this per page is treated as a
+# scan and OCR'd instead (a scanned resume often still carries a short text header)
+MIN_TEXT_LAYER_CHARS = 50
+
+# Rendering resolution for OCR of scanned PDF pages
+OCR_RESOLUTION = 300
+
+def preload_parser_dependencies():
+    """
+    Import the PDF and OCR libraries up front. Parsing imports them lazily so the
+    web process stays light; parsing worker processes call this when they start
+    so the first resume they handle doesn't pay for the imports.
+    A throwaway one-page document also runs MuPDF's one-time setup
+    (allocators, fonts, text extraction) before a real resume arrives.
+    """
+    try:
+        import fitz
+        import pytesseract  # noqa: F401
+        from PIL import Image  # noqa: F401
+    except ImportError as e:
+        # Runs as a process pool initializer; failing here would break the whole pool
+        print(f"⚠️ Could not preload resume parsing dependencies: {e}")
+        return
+
+    try:
+        with fitz.open() as doc:
+            doc.new_page().insert_text((72, 72), "warm up")
+            doc[0].get_text()
+    except Exception as e:
+        print(f"⚠️ Could not warm up PDF text extraction: {e}")
+
+def _open_source(file_content):
+    """PIL opens paths directly, so only wrap raw bytes"""
+    if isinstance(file_content, (str, os.PathLike)):
+        return file_content
+    return io.BytesIO(file_content)
+
+def _open_pdf(file_content):
+    """Open a PDF from bytes (read in place, no BytesIO copy) or from a path"""
+    # Imported on first use so the web process never loads it; parsing workers preload it
+    import fitz
+    if isinstance(file_content, (str, os.PathLike)):
+        return fitz.open(file_content)
+    return fitz.open(stream=file_content, filetype="pdf")
+
+def _extract_pdf_text_layer(doc):
+    """
+    Extract the embedded text layer of a PDF (no OCR) with PyMuPDF. MuPDF's C text
+    extraction is several times faster than pdfplumber's pure-Python layout
+    analysis, which is the bulk of parsing time for text PDFs.
+    Returns (text, page_count).
+    """
+    try:
+        return "".join(page.get_text() for page in doc), doc.page_count
+    except Exception as e:
+        print(f"Error processing PDF: {e}")
+        return "", 0
+
+def _extract_pdf_text(file_content):
+    """
+    Read a resume PDF's text from a single open document: the text layer first,
+    and only for scans (little or no text layer) OCR of pages rendered from that
+    same document, so the file is never parsed a second time.
+    """
+    try:
+        doc = _open_pdf(file_content)
+    except Exception as e:
+        print(f"Error processing PDF: {e}")
+        return ""
+
+    with doc:
+        text, page_count = _extract_pdf_text_layer(doc)
+        if len(text.strip()) < MIN_TEXT_LAYER_CHARS * max(page_count, 1):
+            print("🔍 PDF has no usable text layer, falling back to OCR...")
+            ocr_text = _ocr_pdf(doc)
+            if len(ocr_text.strip()) > len(text.strip()):
+                text = ocr_text
+    return text
+
+def _ocr_image(file_content):
+    """OCR an image resume with Tesseract"""
+    try:
+        from PIL import Image
+        import pytesseract
+        image = Image.open(_open_source(file_content))
+        return pytesseract.image_to_string(image)
+    except Exception as e:
+        print(f"Error processing image: {e}")
+        return ""
+
+def _ocr_pdf(doc):
+    """
+    OCR a scanned PDF, already open in PyMuPDF, with Tesseract.
+    All pages are rendered into one multi-page TIFF and recognised in a single
+    Tesseract run, so the OCR engine starts and loads its model once per resume
+    instead of once per page.
+    """
+    text = ""
+    try:
+        import tempfile
+        import pytesseract
+        from PIL import Image
+        page_images = []
+        for page in doc:
+            pixmap = page.get_pixmap(dpi=OCR_RESOLUTION)
+            page_images.append(Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples))
+        if not page_images:
+            return ""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tiff_path = os.path.join(temp_dir, "pages.tif")
+            page_images[0].save(tiff_path, save_all=True, append_images=page_images[1:])
+            text = pytesseract.image_to_string(tiff_path)
+    except Exception as e:
+        print(f"Error running OCR on PDF: {e}")
+        text = ""
+    return text
+
 def parse_resume(file_content, filename, use_llm=True):
     """
     Parse resume from file content and extract skills using LLM or legacy methods.
     Args:
-        file_content: The file content to parse
+        file_content: The file content to parse, as bytes or a path to the file on disk
         filename: The filename for file type detection
         use_llm: If True, use LLM-based parsing; if False, use legacy text-based parsing
     Returns tuple: (skills_list, resume_text, metadata_dict)
     """
     ext = os.path.splitext(filename)[1].lower() if filename else ''
-    text = ""
     
     if ext in [".png", ".jpg", ".jpeg"]:
-        try:
-            from PIL import Image
-            import pytesseract
-            image = Image.open(io.BytesIO(file_content))
-            text = pytesseract.image_to_string(image)
-        except Exception as e:
-            print(f"Error processing image: {e}")
-            text = ""
+        text = _ocr_image(file_content)
     else:
-        try:
-            with pdfplumber.open(io.BytesIO(file_content)) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text
-        except Exception as e:
-            print(f"Error processing PDF: {e}")
-            text = ""
+        text = _extract_pdf_text(file_content)
 
     # Check if text was extracted successfully
     if not text.strip():
@@ -243,7 +349,7 @@ def extract_skills_with_llm_full(resume_text: str) -> Dict[str, Any]:
     This is used by parse_resume() to get complete resume analysis.
     """
     try:
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        client = get_openai_client()
         response = client.chat.completions.create(
             model="gpt-5-mini-2025-08-07",
             messages=[
@@ -265,22 +371,3 @@ def extract_skills_with_llm_full(resume_text: str) -> Dict[str, Any]:
         print(f"❌ Error with LLM skill extraction: {e}")
         raise Exception(f"LLM skill extraction failed: {str(e)}")
 
-
-def is_valid_resume(text):
-    """Check if the text appears to be from a valid resume"""
-    if not text or len(text.strip()) < 100:
-        return False
-    
-    # Look for common resume indicators
-    resume_indicators = [
-        'experience', 'education', 'skills', 'work', 'employment', 
-        'university', 'college', 'degree', 'bachelor', 'master', 
-        'resume', 'cv', 'curriculum vitae', 'contact', 'email', 
-        'phone', 'project', 'intern', 'job', 'position'
-    ]
-    
-    text_lower = text.lower()
-    found_indicators = sum(1 for indicator in resume_indicators if indicator in text_lower)
-    
-    # Require at least 3 resume indicators
-    return found_indicators >= 3
@@ -0,0 +1,41 @@
+"""
+Lightweight checks on extracted resume text.
+
+Kept apart from parse_resume so callers that only validate text do not pull in
+the PDF, OCR and OpenAI dependencies.
+"""
+import re
+
+
+# Common resume indicators, matched in a single pass over the text.
+# The lookahead lets overlapping indicators match, so every indicator that
+# appears anywhere in the text is found, exactly like a substring check.
+RESUME_INDICATORS = (
+    'experience', 'education', 'skills', 'work', 'employment',
+    'university', 'college', 'degree', 'bachelor', 'master',
+    'resume', 'cv', 'curriculum vitae', 'contact', 'email',
+    'phone', 'project', 'intern', 'job', 'position'
+)
+MIN_RESUME_INDICATORS = 3
+# Case-insensitive, so the text can be scanned without a lowercased copy
+RESUME_INDICATOR_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(indicator) for indicator in RESUME_INDICATORS) + "))",
+    re.IGNORECASE
+)
+
+def is_valid_resume(text, text_lower=None):
+    """
+    Check if the text appears to be from a valid resume.
+    text_lower is scanned instead of text when the caller already has it; the
+    scan is case-insensitive, so no lowercased copy is made otherwise.
+    """
+    if not text or len(text.strip()) < 100:
+        return False
+    
+    # Require at least 3 resume indicators; stop scanning as soon as the third turns up
+    found_indicators = set()
+    for match in RESUME_INDICATOR_PATTERN.finditer(text if text_lower is None else text_lower):
+        found_indicators.add(match.group(1).lower())
+        if len(found_indicators) >= MIN_RESUME_INDICATORS:
+            return True
+    return False
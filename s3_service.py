@@ -1,10 +1,12 @@
 import boto3
 import os
 import uuid
+import logging
 from datetime import datetime
 from typing import Optional, Tuple
-from botocore.exceptions import ClientError, NoCredentialsError
-import io
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
 
 class S3Service:
     def __init__(self):
@@ -23,10 +25,10 @@ class S3Service:
                 
             # Test connection
             self._test_connection()
-            print(f"✅ S3 service initialized successfully with bucket: {self.bucket_name}")
+            logger.info("✅ S3 service initialized successfully with bucket: %s", self.bucket_name)
             
         except Exception as e:
-            print(f"❌ Failed to initialize S3 service: {e}")
+            logger.error("❌ Failed to initialize S3 service: %s", e)
             raise
 
     def _test_connection(self):
@@ -86,11 +88,11 @@ class S3Service:
                 }
             )
             
-            print(f"📤 Uploaded file to S3: {s3_key}")
+            logger.info("📤 Uploaded file to S3: %s", s3_key)
             return s3_key
             
         except Exception as e:
-            print(f"❌ Failed to upload file to S3: {e}")
+            logger.error("❌ Failed to upload file to S3: %s", e)
             raise Exception(f"S3 upload failed: {str(e)}")
 
     def download_file_from_s3(self, s3_key: str) -> Tuple[bytes, str]:
@@ -110,7 +112,7 @@ class S3Service:
             # Get original filename from metadata
             original_filename = response.get('Metadata', {}).get('original_filename', 'resume.pdf')
             
-            print(f"📥 Downloaded file from S3: {s3_key} ({len(file_content)} bytes)")
+            logger.info("📥 Downloaded file from S3: %s (%d bytes)", s3_key, len(file_content))
             return file_content, original_filename
             
         except ClientError as e:
@@ -120,7 +122,7 @@ class S3Service:
             else:
                 raise Exception(f"S3 download error: {e}")
         except Exception as e:
-            print(f"❌ Failed to download file from S3: {e}")
+            logger.error("❌ Failed to download file from S3: %s", e)
             raise Exception(f"S3 download failed: {str(e)}")
 
     def delete_file_from_s3(self, s3_key: str) -> bool:
@@ -135,11 +137,11 @@ class S3Service:
         """
         try:
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
-            print(f"🗑️ Deleted file from S3: {s3_key}")
+            logger.info("🗑️ Deleted file from S3: %s", s3_key)
             return True
             
         except Exception as e:
-            print(f"❌ Failed to delete file from S3: {e}")
+            logger.error("❌ Failed to delete file from S3: %s", e)
             return False
 
     def _get_content_type(self, filename: str) -> str:
@@ -169,7 +171,7 @@ class S3Service:
                 'metadata': response.get('Metadata', {})
             }
         except Exception as e:
-            print(f"❌ Failed to get file info from S3: {e}")
+            logger.error("❌ Failed to get file info from S3: %s", e)
             return {}
 
 # Global S3 service instance